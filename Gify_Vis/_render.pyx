@@ -0,0 +1,21 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Compiled frame kernel for pixelated_gif_terminal.py
+Build in place with: cythonize -i _render.pyx
+"""
+
+
+def render(const unsigned char[:, :, :] arr, const unsigned char[:] ascii_lut,
+           const unsigned char[:] color_lut, unsigned char[:, :] out_chars,
+           unsigned char[:, :] out_colors):
+    """Fill ASCII and palette index grids from an RGB array in one pass"""
+    cdef Py_ssize_t y, x
+    cdef int r, g, b
+    with nogil:
+        for y in range(arr.shape[0]):
+            for x in range(arr.shape[1]):
+                r = arr[y, x, 0]
+                g = arr[y, x, 1]
+                b = arr[y, x, 2]
+                out_chars[y, x] = ascii_lut[(77 * r + 150 * g + 29 * b) >> 8]
+                out_colors[y, x] = color_lut[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)]
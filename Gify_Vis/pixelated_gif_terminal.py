@@ -11,120 +11,421 @@ import argparse
 import threading
 import queue
 import json
+import hashlib
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from PIL import Image, ImageSequence
 import colorama
 from colorama import Fore, Back, Style
-import glob
 import select
 import tty
 import termios
 
+try:
+    # Optional compiled kernel, built with: cythonize -i _render.pyx
+    from _render import render as _render_kernel
+except ImportError:
+    _render_kernel = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Initialize colorama for cross-platform colored output
 colorama.init()
 
+# ANSI control sequences (translated by colorama on Windows)
+CURSOR_HOME = b"\x1b[H"
+CLEAR_SCREEN = b"\x1b[H\x1b[2J"
+CLEAR_LINE_END = b"\x1b[K"
+CLEAR_SCREEN_END = b"\x1b[J"
+RESET = Style.RESET_ALL.encode()
+
+# Below this many frames, worker startup costs more than it saves
+MIN_PARALLEL_FRAMES = 8
+
+# Rendered frames the background loader may queue ahead of playback
+FRAME_PREFETCH = 4
+
+# Processed GIFs are cached on disk and the most recent ones kept in memory
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                         "gify_vis")
+MEMORY_CACHE_SIZE = 4
+
+# The frame pool is started from the loader thread, where fork() is unsafe
+POOL_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
+# Background colors indexed by (r >= 128) << 2 | (g >= 128) << 1 | (b >= 128);
+# with the palette on the RGB cube corners this is the Euclidean nearest color
+ANSI8 = [Back.BLACK, Back.BLUE, Back.GREEN, Back.CYAN,
+         Back.RED, Back.MAGENTA, Back.YELLOW, Back.WHITE]
+
+# Resampling filters selectable with --resample ("auto" picks per frame)
+RESAMPLE_FILTERS = {
+    "box": Image.Resampling.BOX,
+    "bilinear": Image.Resampling.BILINEAR,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+
+if _render_kernel is None and njit is not None:
+    # Serial on purpose: frames render on the loader thread, and a parallel
+    # kernel launched off the main thread can hang Numba's pool at exit
+    @njit(cache=True)
+    def _render_kernel(arr, ascii_lut, color_lut, out_chars, out_colors):
+        """Fill ASCII and palette index grids from an RGB array in one pass"""
+        for y in range(arr.shape[0]):
+            for x in range(arr.shape[1]):
+                r = np.int32(arr[y, x, 0])
+                g = np.int32(arr[y, x, 1])
+                b = np.int32(arr[y, x, 2])
+                out_chars[y, x] = ascii_lut[(77 * r + 150 * g + 29 * b) >> 8]
+                out_colors[y, x] = color_lut[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)]
+
 class PlaybackState:
     STOPPED = "stopped"
     PLAYING = "playing"
     PAUSED = "paused"
 
 class PixelatedGifPlayer:
-    def __init__(self, width=80, height=24, use_colors=True):
+    def __init__(self, width=80, height=24, use_colors=True, resample="auto", colors=256):
         self.width = width
         self.height = height
         self.use_colors = use_colors
+        self.colors = colors
+        self.resample = resample
         self.state = PlaybackState.STOPPED
         self.current_playlist = []
         self.current_index = 0
         self.current_frame = 0
         self.total_frames = 0
-        self.frame_data = []
+        self.next_deadline = None
+        # Frames are stored as uint8 palette/ASCII indices of shape
+        # (frames, height, width); text is only built when displayed
+        self.frame_cells = []
         self.frame_durations = []
-        self.input_queue = queue.Queue()
+        self.prev_cells = None
+        self.frame_queue = None
+        self.loading = False
+        self.loading_path = None
+        self.gif_cache = OrderedDict()
         self.playback_thread = None
-        self.input_thread = None
         self.loop_playlist = True
         self.loop_current = True
         
         # ASCII characters for different brightness levels
         self.ascii_chars = " .:-=+*#%@"
+        self.ascii_bytes = np.frombuffer(self.ascii_chars.encode(), dtype=np.uint8)
+        levels = len(self.ascii_chars)
+        self.ascii_lut = np.minimum(np.arange(256) * levels // 256, levels - 1).astype(np.uint8)
         
-        # Color mapping for RGB to ANSI colors
-        self.color_map = {
-            (0, 0, 0): Back.BLACK,
-            (255, 0, 0): Back.RED,
-            (0, 255, 0): Back.GREEN,
-            (255, 255, 0): Back.YELLOW,
-            (0, 0, 255): Back.BLUE,
-            (255, 0, 255): Back.MAGENTA,
-            (0, 255, 255): Back.CYAN,
-            (255, 255, 255): Back.WHITE,
-        }
+        # Palette index for every 15-bit quantized (r>>3, g>>3, b>>3) color
+        self.color_lut = self.build_color_lut()
+        
+        # Encoded output for each cell index produced by process_frame
+        if self.colors == 256:
+            self.color_codes = [b"\x1b[48;5;%dm" % i for i in range(256)]
+        else:
+            self.color_codes = [code.encode() for code in ANSI8]
+        if self.use_colors:
+            self.cell_strings = [code + b" " for code in self.color_codes]
+        else:
+            self.cell_strings = [bytes([char]) for char in self.ascii_bytes]
         
         # Save terminal settings for input handling
         self.old_settings = None
 
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        self.write_output(CLEAR_SCREEN)
+        self.prev_cells = None
+
+    def write_output(self, data):
+        """Write encoded output to the terminal with as few syscalls as possible"""
+        sys.stdout.flush()
+        if os.name == 'nt':
+            # Go through colorama so ANSI sequences work on the Windows console
+            sys.stdout.write(bytes(data).decode())
+            sys.stdout.flush()
+            return
+        
+        fd = sys.stdout.fileno()
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def build_color_lut(self):
+        """Map every 15-bit quantized RGB value to a palette index"""
+        centers = (np.arange(32) << 3) + 4
+        if self.colors == 256:
+            # xterm 6x6x6 color cube, indices 16-231
+            level = centers * 6 // 256
+            r, g, b = np.meshgrid(level, level, level, indexing='ij')
+            lut = 16 + 36 * r + 6 * g + b
+        else:
+            level = centers >> 7
+            r, g, b = np.meshgrid(level, level, level, indexing='ij')
+            lut = (r << 2) | (g << 1) | b
+        return lut.astype(np.uint8).ravel()
 
-    def rgb_to_ascii(self, r, g, b):
-        """Convert RGB values to ASCII character based on brightness"""
-        brightness = int(0.299 * r + 0.587 * g + 0.114 * b)
-        char_index = min(brightness * len(self.ascii_chars) // 256, len(self.ascii_chars) - 1)
-        return self.ascii_chars[char_index]
+    def resample_filter(self, frame):
+        """Pick the resize filter, favouring speed for large downscales"""
+        if self.resample != "auto":
+            return RESAMPLE_FILTERS[self.resample]
+        if frame.width > self.width * 3:
+            return Image.Resampling.BOX
+        return Image.Resampling.BILINEAR
 
-    def get_closest_color(self, r, g, b):
-        """Find the closest ANSI color to the given RGB"""
-        min_distance = float('inf')
-        closest_color = Back.BLACK
+    def process_frame(self, frame):
+        """Convert a PIL Image frame to a grid of palette or ASCII indices"""
+        frame = frame.resize((self.width, self.height), self.resample_filter(frame))
         
-        for (cr, cg, cb), color_code in self.color_map.items():
-            distance = ((r - cr) ** 2 + (g - cg) ** 2 + (b - cb) ** 2) ** 0.5
-            if distance < min_distance:
-                min_distance = distance
-                closest_color = color_code
+        if frame.mode == 'P':
+            # PIL resizes palette frames with NEAREST, so they stay indexed;
+            # map the (at most 256) palette entries instead of every pixel
+            palette = np.zeros((1, 256, 3), dtype=np.uint8)
+            entries = np.array(frame.getpalette('RGB'), dtype=np.uint8).reshape(-1, 3)
+            palette[0, :len(entries)] = entries
+            return self.map_rgb(palette)[0][np.asarray(frame)]
         
-        return closest_color
+        return self.map_rgb(np.asarray(frame.convert('RGB')))
 
-    def process_frame(self, frame):
-        """Convert a PIL Image frame to ASCII art"""
-        frame = frame.resize((self.width, self.height), Image.Resampling.LANCZOS)
-        frame = frame.convert('RGB')
-        
-        ascii_frame = []
-        for y in range(self.height):
-            row = ""
-            for x in range(self.width):
-                r, g, b = frame.getpixel((x, y))
-                
-                if self.use_colors:
-                    color = self.get_closest_color(r, g, b)
-                    row += color + " " + Style.RESET_ALL
+    def map_rgb(self, arr):
+        """Map a uint8 RGB array to a grid of palette or ASCII indices"""
+        if _render_kernel is not None:
+            chars = np.empty(arr.shape[:2], dtype=np.uint8)
+            colors = np.empty(arr.shape[:2], dtype=np.uint8)
+            _render_kernel(arr, self.ascii_lut, self.color_lut, chars, colors)
+            return colors if self.use_colors else chars
+        
+        arr = arr.astype(np.uint16)
+        if self.use_colors:
+            key = ((arr[..., 0] >> 3) << 10) | ((arr[..., 1] >> 3) << 5) | (arr[..., 2] >> 3)
+            return self.color_lut[key]
+        
+        # Integer weights approximating 0.299/0.587/0.114 luminance
+        bright = (arr[..., 0] * 77 + arr[..., 1] * 150 + arr[..., 2] * 29) >> 8
+        return self.ascii_lut[bright]
+
+    def render_cells(self, cells):
+        """Render a grid of cell indices as newline-separated bytes"""
+        if not self.use_colors:
+            return b"\n".join(row.tobytes() for row in self.ascii_bytes[cells])
+        
+        # Emit each run of same-colored cells as one color code plus spaces
+        codes = self.color_codes
+        width = cells.shape[1]
+        lines = []
+        for row in cells:
+            starts = [0] + (np.flatnonzero(row[1:] != row[:-1]) + 1).tolist()
+            ends = starts[1:] + [width]
+            colors = row[starts].tolist()
+            lines.append(b''.join(codes[color] + b" " * (end - start)
+                                  for color, start, end in zip(colors, starts, ends))
+                         + RESET)
+        return b"\n".join(lines)
+
+    def render_changed_cells(self, cells, changed):
+        """Render only the cells flagged in the changed mask"""
+        strings = self.cell_strings
+        output = []
+        # Background colors persist across cursor moves, so a code is only
+        # needed when the color changes and one reset at the end
+        last_cell = None
+        for y in np.flatnonzero(changed.any(axis=1)).tolist():
+            row = cells[y].tolist()
+            last_x = -2
+            for x in np.flatnonzero(changed[y]).tolist():
+                # Consecutive changed cells continue from the current cursor
+                if x != last_x + 1:
+                    output.append(b"\x1b[%d;%dH" % (y + 1, x + 1))
+                cell = row[x]
+                if self.use_colors and cell == last_cell:
+                    output.append(b" ")
                 else:
-                    char = self.rgb_to_ascii(r, g, b)
-                    row += char
+                    output.append(strings[cell])
+                    last_cell = cell
+                last_x = x
+        if self.use_colors and output:
+            output.append(RESET)
+        return b''.join(output)
+
+    def frame_output(self, cells):
+        """Return the output that turns the previous frame into this one"""
+        prev_cells = self.prev_cells
+        self.prev_cells = cells
+        if prev_cells is not None and prev_cells.shape == cells.shape:
+            changed = cells != prev_cells
+            # Busy frames cost more as cursor moves than as a full redraw
+            if np.count_nonzero(changed) * 2 < changed.size:
+                return (self.render_changed_cells(cells, changed)
+                        + b"\x1b[%d;1H" % (self.height + 1))
+        return CURSOR_HOME + self.render_cells(cells) + b"\n"
+
+    def decode_frames(self, gif_path):
+        """Decode every frame of a GIF along with its duration in seconds"""
+        with Image.open(gif_path) as img:
+            raw_frames = []
+            durations = []
             
-            ascii_frame.append(row)
+            for frame in ImageSequence.Iterator(img):
+                raw_frames.append(frame.copy())
+                duration = frame.info.get('duration', 100) / 1000.0
+                durations.append(duration)
+        
+        return raw_frames, durations
+
+    def iter_frames(self, gif_path):
+        """Yield (cells, duration) for each frame, rendering lazily"""
+        raw_frames, durations = self.decode_frames(gif_path)
         
-        return ascii_frame
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(raw_frames) >= MIN_PARALLEL_FRAMES:
+            ex = ProcessPoolExecutor(max_workers=workers, mp_context=POOL_CONTEXT,
+                                     initializer=_init_frame_worker,
+                                     initargs=(self.width, self.height, self.use_colors,
+                                               self.resample, self.colors))
+            try:
+                results = ex.map(_process_frame_worker, raw_frames, chunksize=4)
+                yield from zip(results, durations)
+            finally:
+                ex.shutdown(cancel_futures=True)
+        else:
+            for frame, duration in zip(raw_frames, durations):
+                yield self.process_frame(frame), duration
+
+    def cache_path(self, gif_path):
+        """Return the disk cache file for a GIF under the current render settings"""
+        mtime = os.stat(gif_path).st_mtime_ns
+        key = (f"{os.path.abspath(gif_path)}|{mtime}|{self.width}x{self.height}|"
+               f"{self.use_colors}|{self.colors}|{self.resample}")
+        return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".npz")
+
+    def remember_gif(self, path, entry):
+        """Keep a processed GIF in the in-memory LRU cache"""
+        self.gif_cache[path] = entry
+        self.gif_cache.move_to_end(path)
+        while len(self.gif_cache) > MEMORY_CACHE_SIZE:
+            self.gif_cache.popitem(last=False)
+
+    def load_cached_gif(self, gif_path):
+        """Return cached (cells, durations) for a GIF, or (None, None)"""
+        try:
+            path = self.cache_path(gif_path)
+        except OSError:
+            return None, None
+        
+        if path in self.gif_cache:
+            self.gif_cache.move_to_end(path)
+            return self.gif_cache[path]
+        
+        try:
+            with np.load(path) as data:
+                entry = data['cells'], data['durations'].tolist()
+        except (OSError, KeyError, ValueError):
+            return None, None
+        
+        self.remember_gif(path, entry)
+        return entry
+
+    def store_cached_gif(self, gif_path, cells, durations):
+        """Save a processed GIF to the memory and disk caches"""
+        try:
+            path = self.cache_path(gif_path)
+            self.remember_gif(path, (cells, durations))
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, cells=cells, durations=np.array(durations))
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
 
     def load_gif(self, gif_path):
         """Load and process a GIF file"""
+        cells, durations = self.load_cached_gif(gif_path)
+        if cells is not None:
+            return cells, durations
+        
         try:
-            with Image.open(gif_path) as img:
-                frames = []
-                durations = []
-                
-                for frame in ImageSequence.Iterator(img):
-                    ascii_frame = self.process_frame(frame.copy())
-                    frames.append(ascii_frame)
-                    duration = frame.info.get('duration', 100) / 1000.0
-                    durations.append(duration)
-                
-                return frames, durations
+            frames = list(self.iter_frames(gif_path))
         except Exception as e:
             print(f"Error loading {gif_path}: {e}")
             return None, None
+        
+        if not frames:
+            return None, None
+        cells = np.stack([frame_cells for frame_cells, _ in frames])
+        durations = [duration for _, duration in frames]
+        self.store_cached_gif(gif_path, cells, durations)
+        return cells, durations
+
+    def start_frame_loader(self, gif_path):
+        """Start rendering a GIF in the background, superseding any current loader"""
+        self.frame_cells = []
+        self.frame_durations = []
+        self.frame_queue = queue.Queue(maxsize=FRAME_PREFETCH)
+        self.loading = True
+        self.loading_path = gif_path
+        loader = threading.Thread(target=self.frame_loader, args=(gif_path, self.frame_queue),
+                                  daemon=True)
+        loader.start()
+
+    def offer_frame(self, frame_queue, item):
+        """Queue an item for playback; return False once the loader is superseded"""
+        while frame_queue is self.frame_queue:
+            try:
+                frame_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def frame_loader(self, gif_path, frame_queue):
+        """Render frames ahead of playback, ending the stream with whether it completed"""
+        frames = self.iter_frames(gif_path)
+        completed = False
+        try:
+            for item in frames:
+                if not self.offer_frame(frame_queue, item):
+                    return
+            completed = True
+        except Exception as e:
+            print(f"Error loading {gif_path}: {e}")
+        finally:
+            frames.close()
+        self.offer_frame(frame_queue, completed)
+
+    def collect_frames(self, timeout=0):
+        """Move frames from the loader into the buffer kept for replays"""
+        while self.loading:
+            try:
+                if timeout:
+                    item = self.frame_queue.get(timeout=timeout)
+                else:
+                    item = self.frame_queue.get_nowait()
+            except queue.Empty:
+                break
+            timeout = 0
+            
+            if isinstance(item, bool):
+                self.loading = False
+                # Pack the finished GIF into one contiguous array
+                if self.frame_cells:
+                    self.frame_cells = np.stack(self.frame_cells)
+                    if item:
+                        self.store_cached_gif(self.loading_path, self.frame_cells,
+                                              self.frame_durations)
+            else:
+                frame_cells, duration = item
+                self.frame_cells.append(frame_cells)
+                self.frame_durations.append(duration)
+        
+        self.total_frames = len(self.frame_cells)
 
     def setup_input_handling(self):
         """Setup non-blocking input handling (Unix only)"""
@@ -137,23 +438,24 @@ class PixelatedGifPlayer:
         if self.old_settings:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self.old_settings)
 
-    def input_handler(self):
-        """Handle keyboard input in a separate thread"""
-        while self.state != PlaybackState.STOPPED:
-            try:
-                if os.name == 'nt':  # Windows
-                    import msvcrt
-                    if msvcrt.kbhit():
-                        key = msvcrt.getch().decode('utf-8').lower()
-                        self.input_queue.put(key)
-                else:  # Unix/Linux/macOS
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
-                        key = sys.stdin.read(1).lower()
-                        self.input_queue.put(key)
-                
-                time.sleep(0.05)  # Small delay to prevent excessive CPU usage
-            except:
-                break
+    def read_key(self, timeout=None):
+        """Wait up to timeout seconds (forever if None) for a key; return it or None"""
+        if os.name == 'nt':  # Windows
+            import msvcrt
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while not msvcrt.kbhit():
+                remaining = 0.01 if deadline is None else deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                time.sleep(min(remaining, 0.01))
+            return msvcrt.getch().decode('utf-8', 'ignore').lower()
+        
+        # Unix/Linux/macOS
+        if timeout is not None:
+            timeout = max(0, timeout)
+        if select.select([sys.stdin], [], [], timeout)[0]:
+            return sys.stdin.read(1).lower()
+        return None
 
     def display_controls(self):
         """Display control information"""
@@ -168,52 +470,49 @@ class PixelatedGifPlayer:
 
     def display_frame(self):
         """Display the current frame with controls"""
-        self.clear_screen()
-        
-        # Display the GIF frame
-        if self.frame_data and self.current_frame < len(self.frame_data):
-            for line in self.frame_data[self.current_frame]:
-                print(line)
+        # Only changed cells and the footer are written once the first
+        # frame is on screen
+        buf = bytearray()
+        if self.current_frame < len(self.frame_cells):
+            buf += self.frame_output(self.frame_cells[self.current_frame])
+        else:
+            buf += CURSOR_HOME
         
-        # Display controls and status
-        print("\n" + "="*80)
+        footer = ["", "=" * 80]
         if self.current_playlist:
             current_gif = os.path.basename(self.current_playlist[self.current_index])
-            print(f"Now Playing: {current_gif}")
+            footer.append(f"Now Playing: {current_gif}")
+        footer.extend(self.display_controls())
         
-        for control in self.display_controls():
-            print(control)
+        for line in footer:
+            buf += line.encode()
+            buf += CLEAR_LINE_END + b"\n"
+        buf += CLEAR_SCREEN_END
+        self.write_output(buf)
 
-    def process_input(self):
-        """Process keyboard input"""
-        try:
-            while not self.input_queue.empty():
-                key = self.input_queue.get_nowait()
-                
-                if key == ' ':  # Space - Play/Pause
-                    if self.state == PlaybackState.PLAYING:
-                        self.state = PlaybackState.PAUSED
-                    elif self.state == PlaybackState.PAUSED:
-                        self.state = PlaybackState.PLAYING
-                
-                elif key == 'n':  # Next GIF
-                    self.next_gif()
-                
-                elif key == 'p':  # Previous GIF
-                    self.previous_gif()
-                
-                elif key == 'r':  # Restart current GIF
-                    self.current_frame = 0
-                
-                elif key == 'l':  # Toggle loop
-                    self.loop_current = not self.loop_current
-                
-                elif key == 'q':  # Quit
-                    self.state = PlaybackState.STOPPED
-                    return False
+    def process_input(self, key):
+        """Process a keypress; return False when playback should stop"""
+        if key == ' ':  # Space - Play/Pause
+            if self.state == PlaybackState.PLAYING:
+                self.state = PlaybackState.PAUSED
+            elif self.state == PlaybackState.PAUSED:
+                self.state = PlaybackState.PLAYING
         
-        except queue.Empty:
-            pass
+        elif key == 'n':  # Next GIF
+            self.next_gif()
+        
+        elif key == 'p':  # Previous GIF
+            self.previous_gif()
+        
+        elif key == 'r':  # Restart current GIF
+            self.current_frame = 0
+        
+        elif key == 'l':  # Toggle loop
+            self.loop_current = not self.loop_current
+        
+        elif key == 'q':  # Quit
+            self.state = PlaybackState.STOPPED
+            return False
         
         return True
 
@@ -233,32 +532,40 @@ class PixelatedGifPlayer:
         """Load the current GIF from the playlist"""
         if self.current_playlist and 0 <= self.current_index < len(self.current_playlist):
             gif_path = self.current_playlist[self.current_index]
-            self.frame_data, self.frame_durations = self.load_gif(gif_path)
-            if self.frame_data:
-                self.total_frames = len(self.frame_data)
-                self.current_frame = 0
+            self.prev_cells = None
+            self.current_frame = 0
+            self.next_deadline = None
+            
+            cells, durations = self.load_cached_gif(gif_path)
+            if cells is not None:
+                # Supersede any loader still rendering the previous GIF
+                self.frame_queue = None
+                self.loading = False
+                self.frame_cells, self.frame_durations = cells, durations
+                self.total_frames = len(cells)
                 return True
+            
+            self.start_frame_loader(gif_path)
+            
+            # Only wait for the first frame; the rest render during playback
+            while self.loading and not len(self.frame_cells):
+                self.collect_frames(timeout=0.1)
+            return len(self.frame_cells) > 0
         return False
 
     def playback_loop(self):
         """Main playback loop"""
         while self.state != PlaybackState.STOPPED:
-            if not self.process_input():
-                break
-            
-            if self.state == PlaybackState.PLAYING and self.frame_data:
-                self.display_frame()
-                
-                # Wait for frame duration
-                if self.current_frame < len(self.frame_durations):
-                    time.sleep(self.frame_durations[self.current_frame])
-                
-                # Advance frame
-                self.current_frame += 1
+            if self.state == PlaybackState.PLAYING and len(self.frame_cells):
+                self.collect_frames()
                 
                 # Handle end of GIF
                 if self.current_frame >= self.total_frames:
-                    if self.loop_current:
+                    if self.loading:
+                        # Playback caught up with the loader
+                        self.collect_frames(timeout=0.1)
+                        self.next_deadline = None
+                    elif self.loop_current:
                         self.current_frame = 0
                     else:
                         # Move to next GIF in playlist
@@ -266,13 +573,40 @@ class PixelatedGifPlayer:
                             self.next_gif()
                         else:
                             self.state = PlaybackState.PAUSED
+                    continue
+                
+                if self.next_deadline is None:
+                    self.next_deadline = time.perf_counter()
+                self.display_frame()
+                
+                # Wait until this frame's deadline; a keypress ends the wait early
+                self.next_deadline += self.frame_durations[self.current_frame]
+                key = self.read_key(self.next_deadline - time.perf_counter())
+                if key is None:
+                    self.current_frame += 1
+                    self.skip_late_frames()
+                else:
+                    self.next_deadline = None
             
             elif self.state == PlaybackState.PAUSED:
+                self.collect_frames()
                 self.display_frame()
-                time.sleep(0.1)
+                key = self.read_key()
             
             else:
-                time.sleep(0.1)
+                key = self.read_key()
+            
+            if key is not None and not self.process_input(key):
+                break
+
+    def skip_late_frames(self):
+        """Drop frames whose display slot has already passed on a slow terminal"""
+        now = time.perf_counter()
+        durations = self.frame_durations
+        while (self.current_frame < self.total_frames - 1
+               and now >= self.next_deadline + durations[self.current_frame]):
+            self.next_deadline += durations[self.current_frame]
+            self.current_frame += 1
 
     def create_playlist(self, paths):
         """Create a playlist from given paths"""
@@ -289,16 +623,11 @@ class PixelatedGifPlayer:
 
     def find_gif_files(self, directory):
         """Find all GIF files in a directory"""
-        gif_patterns = [
-            os.path.join(directory, "*.gif"),
-            os.path.join(directory, "*.GIF")
-        ]
-        
-        gif_files = []
-        for pattern in gif_patterns:
-            gif_files.extend(glob.glob(pattern))
-        
-        return sorted(gif_files)
+        with os.scandir(directory) as entries:
+            # Hidden files stay hidden, as they were from glob
+            return sorted(entry.path for entry in entries
+                          if not entry.name.startswith('.')
+                          and entry.name.lower().endswith('.gif') and entry.is_file())
 
     def save_playlist(self, filename):
         """Save current playlist to a file"""
@@ -357,11 +686,8 @@ class PixelatedGifPlayer:
         try:
             self.setup_input_handling()
             
-            # Start input handler thread
-            self.input_thread = threading.Thread(target=self.input_handler, daemon=True)
-            self.input_thread.start()
-            
             # Start playback
+            self.clear_screen()
             self.state = PlaybackState.PLAYING
             self.playback_loop()
         
@@ -375,24 +701,26 @@ class PixelatedGifPlayer:
         for i, gif_path in enumerate(self.current_playlist):
             print(f"\nNow playing: {os.path.basename(gif_path)} ({i+1}/{len(self.current_playlist)})")
             
-            frame_data, frame_durations = self.load_gif(gif_path)
-            if not frame_data:
+            frame_cells, frame_durations = self.load_gif(gif_path)
+            if frame_cells is None:
                 continue
             
             try:
+                self.clear_screen()
                 frame_index = 0
+                next_deadline = time.perf_counter()
                 while True:
-                    self.clear_screen()
-                    
                     # Display frame
-                    for line in frame_data[frame_index]:
-                        print(line)
+                    buf = bytearray(self.frame_output(frame_cells[frame_index]))
+                    buf += (f"\nFrame {frame_index + 1}/{len(frame_cells)} - "
+                            f"{os.path.basename(gif_path)}").encode()
+                    buf += CLEAR_LINE_END + b"\nPress Ctrl+C to skip to next GIF or stop\n"
+                    self.write_output(buf)
                     
-                    print(f"\nFrame {frame_index + 1}/{len(frame_data)} - {os.path.basename(gif_path)}")
-                    print("Press Ctrl+C to skip to next GIF or stop")
-                    
-                    time.sleep(frame_durations[frame_index])
-                    frame_index = (frame_index + 1) % len(frame_data)
+                    # Sleep to an absolute deadline so render time does not add up
+                    next_deadline += frame_durations[frame_index]
+                    time.sleep(max(0, next_deadline - time.perf_counter()))
+                    frame_index = (frame_index + 1) % len(frame_cells)
                     
                     if frame_index == 0 and not loop:
                         break
@@ -404,6 +732,20 @@ class PixelatedGifPlayer:
                     continue
 
 
+# Per-process player used by load_gif's worker pool
+_worker_player = None
+
+
+def _init_frame_worker(width, height, use_colors, resample, colors):
+    global _worker_player
+    _worker_player = PixelatedGifPlayer(width=width, height=height, use_colors=use_colors,
+                                        resample=resample, colors=colors)
+
+
+def _process_frame_worker(frame):
+    return _worker_player.process_frame(frame)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Enhanced Interactive Pixelated GIF Terminal Player")
     parser.add_argument("paths", nargs='*', help="Paths to GIF files or directories")
@@ -412,6 +754,10 @@ def main():
     parser.add_argument("--no-color", action="store_true", help="Use ASCII characters instead of colors")
     parser.add_argument("--simple", action="store_true", help="Use simple playback mode (no interactive controls)")
     parser.add_argument("--no-loop", action="store_true", help="Don't loop individual GIFs")
+    parser.add_argument("--colors", type=int, choices=[8, 256], default=256,
+                        help="Color palette size (default: 256)")
+    parser.add_argument("--resample", choices=["auto"] + list(RESAMPLE_FILTERS), default="auto",
+                        help="Resize filter (default: auto, box/bilinear by scale)")
     parser.add_argument("--save-playlist", type=str, help="Save playlist to file")
     parser.add_argument("--load-playlist", type=str, help="Load playlist from file")
     
@@ -421,7 +767,9 @@ def main():
     player = PixelatedGifPlayer(
         width=args.width,
         height=args.height,
-        use_colors=not args.no_color
+        use_colors=not args.no_color,
+        resample=args.resample,
+        colors=args.colors
     )
     
     try:
@@ -0,0 +1,145 @@
+# cython: language_level=3
+"""
+Compiled directory walker for disk_monitor.py
+Build in place with: cythonize -i _du.pyx
+"""
+
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport strlen, memcpy
+from posix.stat cimport struct_stat, S_ISREG, S_ISDIR
+
+
+cdef extern from "<dirent.h>" nogil:
+    ctypedef struct DIR:
+        pass
+    struct dirent:
+        unsigned char d_type
+        char d_name[256]
+    DIR *opendir(const char *name)
+    dirent *readdir(DIR *dirp)
+    int closedir(DIR *dirp)
+    int dirfd(DIR *dirp)
+    enum:
+        DT_UNKNOWN
+        DT_DIR
+        DT_REG
+
+cdef extern from "<string.h>" nogil:
+    char *strdup(const char *s)
+
+cdef extern from "<fcntl.h>" nogil:
+    enum:
+        AT_SYMLINK_NOFOLLOW
+
+cdef extern from "<sys/stat.h>" nogil:
+    int fstatat(int dirfd, const char *pathname, struct_stat *buf, int flags)
+
+
+cdef struct Pending:
+    char *path
+    int depth
+
+
+cdef char *join_path(const char *parent, const char *name) noexcept nogil:
+    cdef size_t parent_len = strlen(parent)
+    cdef size_t name_len = strlen(name)
+    cdef char *path = <char *>malloc(parent_len + name_len + 2)
+    if path == NULL:
+        return NULL
+    memcpy(path, parent, parent_len)
+    path[parent_len] = b'/'
+    memcpy(path + parent_len + 1, name, name_len + 1)
+    return path
+
+
+def sum_sizes(bytes path, int max_depth=-1, long long root_dev=-1):
+    """Total size of regular files under path, descending max_depth levels (negative for no limit) without following symlinks"""
+    cdef unsigned long long total = 0
+    cdef Pending *stack
+    cdef Pending *grown
+    cdef Pending top
+    cdef size_t count = 0, capacity = 64
+    cdef DIR *d
+    cdef dirent *ent
+    cdef struct_stat st
+    cdef char *child
+    cdef const char *name
+    cdef bint is_reg, is_dir, need_stat, at_limit, failed = False
+
+    if max_depth == 0:
+        return 0
+
+    stack = <Pending *>malloc(capacity * sizeof(Pending))
+    if stack == NULL:
+        raise MemoryError()
+    stack[0].path = strdup(path)
+    if stack[0].path == NULL:
+        free(stack)
+        raise MemoryError()
+    stack[0].depth = 0
+    count = 1
+
+    with nogil:
+        while count > 0:
+            count -= 1
+            top = stack[count]
+            d = opendir(top.path)
+            if d == NULL:
+                free(top.path)
+                continue
+            at_limit = max_depth > 0 and top.depth + 1 >= max_depth
+
+            while True:
+                ent = readdir(d)
+                if ent == NULL:
+                    break
+                name = ent.d_name
+                if name[0] == b'.' and (name[1] == 0 or (name[1] == b'.' and name[2] == 0)):
+                    continue
+
+                is_reg = ent.d_type == DT_REG
+                is_dir = ent.d_type == DT_DIR
+                if is_dir and at_limit:
+                    continue
+                # Regular files need their size; directories only need st_dev under -x
+                need_stat = is_reg or ent.d_type == DT_UNKNOWN or (is_dir and root_dev >= 0)
+                if need_stat:
+                    if fstatat(dirfd(d), name, &st, AT_SYMLINK_NOFOLLOW) != 0:
+                        continue
+                    is_reg = S_ISREG(st.st_mode)
+                    is_dir = S_ISDIR(st.st_mode)
+
+                if is_reg:
+                    total += st.st_size
+                elif is_dir and not at_limit:
+                    if root_dev >= 0 and <long long>st.st_dev != root_dev:
+                        continue
+                    child = join_path(top.path, name)
+                    if child == NULL:
+                        failed = True
+                        break
+                    if count == capacity:
+                        grown = <Pending *>realloc(stack, 2 * capacity * sizeof(Pending))
+                        if grown == NULL:
+                            free(child)
+                            failed = True
+                            break
+                        stack = grown
+                        capacity *= 2
+                    stack[count].path = child
+                    stack[count].depth = top.depth + 1
+                    count += 1
+
+            closedir(d)
+            free(top.path)
+            if failed:
+                break
+
+        while count > 0:
+            count -= 1
+            free(stack[count].path)
+
+    free(stack)
+    if failed:
+        raise MemoryError()
+    return total
@@ -1,19 +1,39 @@
 #!/usr/bin/env python3
 """
 Terminal disk usage visualizer with ASCII bars
-Usage: python disk_monitor.py [path]
+Usage: python disk_monitor.py [-x] [path]
+
+  -x, --one-file-system  skip directories on other filesystems, like du -x
 """
 
 import os
 import sys
+import time
+import heapq
 import shutil
-from rich.console import Console
-from rich.progress import Progress, BarColumn, TextColumn, MofNCompleteColumn
-from rich.table import Table
-from rich.tree import Tree
-from rich.panel import Panel
-from rich import print as rprint
-import argparse
+from collections import Counter, deque
+from functools import lru_cache
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+try:
+    import fast_stat
+except ImportError:
+    fast_stat = None
+
+try:
+    # Optional compiled walker, built with: cythonize -i _du.pyx
+    from _du import sum_sizes
+except ImportError:
+    sum_sizes = None
+
+# Directory walks are bound by scandir/stat syscalls, which release the GIL
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Only fan out directories with more subdirectories than this; smaller ones are walked inline
+PARALLEL_SUBDIRS = 4
+# Mounts where statx(AT_STATX_DONT_SYNC) saves a server round trip per file
+NETWORK_FILESYSTEMS = frozenset({'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs',
+                                 'ceph', 'lustre', 'glusterfs', 'fuse.glusterfs', '9p'})
 
 def get_disk_usage(path):
     """Get disk usage statistics for a given path"""
@@ -25,96 +45,304 @@ def get_disk_usage(path):
         'percent': (used / total) * 100
     }
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB', 'EB')
+
+# Window over which CPU and disk I/O utilisation are measured
+SAMPLE_INTERVAL = 0.2
+
+BAR_WIDTH = 30
+_FULL_BAR = "█" * BAR_WIDTH
+_EMPTY_BAR = "░" * BAR_WIDTH
+
 def format_bytes(bytes_val):
     """Format bytes to human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_val < 1024.0:
-            return f"{bytes_val:.1f} {unit}"
-        bytes_val /= 1024.0
-    return f"{bytes_val:.1f} PB"
+    if bytes_val < 1024:
+        return f"{bytes_val:.1f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    shift = min((bytes_val.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{bytes_val / (1 << (shift * 10)):.1f} {_UNITS[shift]}"
 
-def get_directory_size(path, max_depth=2, current_depth=0):
-    """Get directory sizes recursively"""
-    if current_depth >= max_depth:
-        return 0
-    
-    total_size = 0
-    items = []
+def read_cpu_times():
+    """Return (busy, total) jiffies from the aggregate cpu line of /proc/stat"""
+    with open('/proc/stat') as f:
+        # user nice system idle iowait irq softirq steal; guest time is already in user
+        fields = [int(value) for value in f.readline().split()[1:9]]
+    total = sum(fields)
+    return total - fields[3] - fields[4], total
+
+def read_memory_percent():
+    """Percentage of memory in use according to /proc/meminfo"""
+    meminfo = {}
+    with open('/proc/meminfo') as f:
+        for line in f:
+            key, value = line.split(':', 1)
+            if key in ('MemTotal', 'MemAvailable'):
+                meminfo[key] = int(value.split()[0])
+                if len(meminfo) == 2:
+                    break
+    return 100 * (1 - meminfo['MemAvailable'] / meminfo['MemTotal'])
+
+def find_mount(path):
+    """Return (source, filesystem type) of the mount containing path from /proc/mounts"""
+    path = os.path.realpath(path)
+    mount_point, source, fs_type = '', None, None
+    with open('/proc/mounts') as f:
+        for line in f:
+            device, mount, mount_type = line.split()[:3]
+            mount = mount.replace('\\040', ' ')
+            # Later entries win at equal length so over-mounts shadow what they cover
+            if (path == mount or path.startswith(mount.rstrip('/') + '/')) and len(mount) >= len(mount_point):
+                mount_point, source, fs_type = mount, device, mount_type
+    return source, fs_type
+
+def find_block_device(path):
+    """Name of the block device backing path's mount, or None"""
+    source, _ = find_mount(path)
+    if not source or not source.startswith('/dev/'):
+        return None
+    name = os.path.basename(os.path.realpath(source))
+    return name if os.path.exists(f'/sys/class/block/{name}/stat') else None
+
+def read_io_ticks(device):
+    """Milliseconds the device has spent doing I/O (field 10 of its sysfs stat)"""
+    with open(f'/sys/class/block/{device}/stat') as f:
+        return int(f.read().split()[9])
+
+def get_system_metrics(path):
+    """Sample CPU, memory and disk I/O utilisation from procfs/sysfs (Linux only)"""
+    metrics = {}
+    if not sys.platform.startswith('linux'):
+        return metrics
     
     try:
-        for item in os.listdir(path):
-            item_path = os.path.join(path, item)
-            if os.path.isfile(item_path):
-                total_size += os.path.getsize(item_path)
-            elif os.path.isdir(item_path):
-                dir_size = get_directory_size(item_path, max_depth, current_depth + 1)
-                total_size += dir_size
-                items.append((item, dir_size))
-    except (PermissionError, FileNotFoundError):
+        metrics['memory'] = read_memory_percent()
+    except (OSError, KeyError, ValueError, ZeroDivisionError):
         pass
     
-    return total_size
+    try:
+        cpu_before = read_cpu_times()
+    except (OSError, ValueError, IndexError):
+        cpu_before = None
+    try:
+        device = find_block_device(path)
+        io_before = read_io_ticks(device) if device else None
+    except (OSError, ValueError, IndexError):
+        io_before = None
+    if cpu_before is None and io_before is None:
+        return metrics
+    
+    started = time.monotonic()
+    time.sleep(SAMPLE_INTERVAL)
+    
+    if cpu_before is not None:
+        try:
+            busy, total = read_cpu_times()
+            if total > cpu_before[1]:
+                metrics['cpu'] = 100 * (busy - cpu_before[0]) / (total - cpu_before[1])
+        except (OSError, ValueError, IndexError):
+            pass
+    if io_before is not None:
+        try:
+            elapsed_ms = (time.monotonic() - started) * 1000
+            metrics['disk_io'] = min(100, 100 * (read_io_ticks(device) - io_before) / elapsed_ms)
+        except (OSError, ValueError, IndexError):
+            pass
+    
+    return metrics
+
+def use_statx(path):
+    """Whether file sizes under path should come from fast_stat rather than DirEntry.stat"""
+    # On local disks the ctypes call costs more than the stat it replaces
+    if fast_stat is None or not fast_stat.AVAILABLE:
+        return False
+    try:
+        return find_mount(path)[1] in NETWORK_FILESYSTEMS
+    except (OSError, ValueError):
+        return False
+
+def scan_directory(path, max_depth, current_depth, root_dev=None, dont_sync=False):
+    """Sum file sizes under path, returning (size, subdirectories left for the pool)"""
+    if sum_sizes is not None and not dont_sync:
+        # The compiled walker covers the whole subtree with the GIL released
+        return sum_sizes(os.fsencode(path), -1 if max_depth is None else max_depth - current_depth,
+                         -1 if root_dev is None else root_dev), []
+    
+    total_size = 0
+    deferred = []
+    # An explicit stack keeps deep trees clear of the recursion limit
+    stack = deque([(path, current_depth)])
+    
+    while stack:
+        dir_path, depth = stack.pop()
+        subdirs = []
+        # Prune at the depth limit here rather than scheduling scans that return nothing
+        descend = max_depth is None or depth + 1 < max_depth
+        dir_fd = None
+        
+        try:
+            if dont_sync:
+                dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+            # scandir entries carry the file type, so only sizes need a stat call
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            if dir_fd is None:
+                                total_size += entry.stat(follow_symlinks=False).st_size
+                            else:
+                                total_size += fast_stat.size(dir_fd, entry.name)
+                        elif descend and entry.is_dir(follow_symlinks=False):
+                            # With root_dev set, stay on one filesystem like du -x
+                            if root_dev is None or entry.stat(follow_symlinks=False).st_dev == root_dev:
+                                subdirs.append((entry.path, depth + 1))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        
+        # Wide directories go back to the pool, narrow ones stay on this worker
+        if len(subdirs) > PARALLEL_SUBDIRS:
+            deferred.extend(subdirs)
+        else:
+            stack.extend(subdirs)
+    
+    return total_size, deferred
 
-def create_file_tree(path, max_items=10):
+@lru_cache(maxsize=32)
+def walk_sizes(path, max_depth=None, one_file_system=False):
+    """Size every direct child of path in one walk, returning (sizes, directory names); max_depth=None is unlimited"""
+    with os.scandir(path) as it:
+        entries = list(it)
+    
+    root_dev = os.stat(path).st_dev if one_file_system else None
+    dont_sync = use_statx(path)
+    
+    sizes = Counter()
+    dirs = set()
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            dirs.add(entry.name)
+            sizes[entry.name] = 0
+            if (max_depth is None or max_depth > 1) and (root_dev is None or
+                                  entry.stat(follow_symlinks=False).st_dev == root_dev):
+                subdirs.append(entry)
+        else:
+            sizes[entry.name] = entry.stat(follow_symlinks=False).st_size
+    
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        pending = {executor.submit(scan_directory, entry.path, max_depth, 1, root_dev, dont_sync): entry.name
+                   for entry in subdirs}
+        
+        # Tasks hand their wide subdirectories back instead of waiting on them,
+        # so workers never block on each other
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                child = pending.pop(future)
+                size, deferred = future.result()
+                sizes[child] += size
+                for subdir, depth in deferred:
+                    pending[executor.submit(scan_directory, subdir, max_depth, depth, root_dev, dont_sync)] = child
+    
+    return sizes, frozenset(dirs)
+
+def get_directory_size(path, max_depth=None, one_file_system=False):
+    """Get directory sizes recursively"""
+    try:
+        sizes, _ = walk_sizes(path, max_depth, one_file_system)
+    except OSError:
+        return 0
+    return sum(sizes.values())
+
+def create_file_tree(path, max_items=10, one_file_system=False):
     """Create a visual file tree"""
+    from rich.tree import Tree
     tree = Tree(f"📁 {os.path.basename(path) or path}")
     
     try:
-        items = []
-        for item in os.listdir(path):
-            item_path = os.path.join(path, item)
-            if os.path.isdir(item_path):
-                size = get_directory_size(item_path, max_depth=1)
-                items.append((item, size, True))
-            else:
-                size = os.path.getsize(item_path)
-                items.append((item, size, False))
-        
-        # Sort by size, largest first
-        items.sort(key=lambda x: x[1], reverse=True)
+        sizes, dirs = walk_sizes(path, one_file_system=one_file_system)
+        # Parallel name/size lists, ranked by index, instead of a tuple per entry
+        names = list(sizes)
+        values = list(sizes.values())
         
-        for i, (name, size, is_dir) in enumerate(items[:max_items]):
-            icon = "📁" if is_dir else "📄"
-            size_str = format_bytes(size)
-            tree.add(f"{icon} {name} ({size_str})")
+        # Largest first; a bounded heap avoids sorting every entry for the top few
+        for i in heapq.nlargest(max_items, range(len(values)), key=values.__getitem__):
+            icon = "📁" if names[i] in dirs else "📄"
+            size_str = format_bytes(values[i])
+            tree.add(f"{icon} {names[i]} ({size_str})")
             
-    except (PermissionError, FileNotFoundError):
+    except OSError:
         tree.add("❌ Permission denied")
     
     return tree
 
-def main():
+def build_parser():
+    """Full argparse parser, used only for --help and usage errors"""
+    import argparse
     parser = argparse.ArgumentParser(description="Terminal disk usage visualizer")
     parser.add_argument("path", nargs="?", default=".", help="Path to analyze (default: current directory)")
-    args = parser.parse_args()
-    
-    console = Console()
+    parser.add_argument("-x", "--one-file-system", action="store_true",
+                        help="Skip directories on other filesystems")
+    return parser
+
+def parse_args(argv):
+    """Parse [-x] [path] by hand so the common case never imports argparse"""
+    paths = []
+    one_file_system = False
+    options_done = False
+    for arg in argv:
+        if options_done or arg == "-" or not arg.startswith("-"):
+            paths.append(arg)
+        elif arg == "--":
+            options_done = True
+        elif arg in ("-x", "--one-file-system"):
+            one_file_system = True
+        else:
+            # --help, or an option argparse should report
+            return build_parser().parse_args(argv)
+    if len(paths) > 1:
+        return build_parser().parse_args(argv)
+    return SimpleNamespace(path=paths[0] if paths else ".", one_file_system=one_file_system)
+
+def main():
+    args = parse_args(sys.argv[1:])
     
-    # Get disk usage
+    # Get disk usage; a bad path is reported before Rich is imported
     try:
         disk_info = get_disk_usage(args.path)
     except (FileNotFoundError, PermissionError) as e:
-        console.print(f"[red]Error: {e}[/red]")
+        print(f"Error: {e}")
         sys.exit(1)
     
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.progress import Progress, BarColumn, TextColumn, MofNCompleteColumn
+    from rich.style import Style
+    from rich.table import Table
+    
+    # Parsed once so Rich does not re-parse style strings while rendering
+    cyan, magenta, green, blue = map(Style.parse, ("cyan", "magenta", "green", "blue"))
+    
+    # Output is all explicit markup, so skip Rich's repr highlighter pass
+    console = Console(highlight=False)
+    
     # Create main display
     console.clear()
     console.print("\n[bold blue]🔍 Terminal Disk Analyzer[/bold blue]\n")
     
     # Disk usage summary
     table = Table(title=f"Disk Usage for: {os.path.abspath(args.path)}")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="magenta")
-    table.add_column("Visual", style="green")
-    
-    # Create progress bar for disk usage
-    used_gb = disk_info['used'] / (1024**3)
-    total_gb = disk_info['total'] / (1024**3)
+    table.add_column("Metric", style=cyan)
+    table.add_column("Value", style=magenta)
+    table.add_column("Visual", style=green)
     
     # ASCII progress bar
-    bar_width = 30
-    filled = int((disk_info['percent'] / 100) * bar_width)
-    bar = "█" * filled + "░" * (bar_width - filled)
+    filled = disk_info['used'] * BAR_WIDTH // disk_info['total']
+    bar = _FULL_BAR[:filled] + _EMPTY_BAR[filled:]
     
     table.add_row("Total Space", format_bytes(disk_info['total']), "")
     table.add_row("Used Space", format_bytes(disk_info['used']), f"[red]{bar}[/red]")
@@ -124,10 +352,12 @@ def main():
     console.print()
     
     # File tree
-    console.print(Panel(create_file_tree(args.path), title="📂 Directory Contents", border_style="blue"))
+    file_tree = create_file_tree(args.path, one_file_system=args.one_file_system)
+    console.print(Panel(file_tree, title="📂 Directory Contents", border_style=blue))
     
-    # Speed test simulation
+    # Live system metrics
     console.print("\n[bold green]📊 Performance Metrics[/bold green]")
+    metrics = get_system_metrics(args.path)
     
     with Progress(
         TextColumn("[progress.description]{task.description}"),
@@ -136,14 +366,11 @@ def main():
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
     ) as progress:
         
-        # Simulate some metrics
-        cpu_task = progress.add_task("CPU Usage", total=100)
-        mem_task = progress.add_task("Memory Usage", total=100)
-        disk_task = progress.add_task("Disk Usage", total=100)
+        for label, key in (("CPU Usage", 'cpu'), ("Memory Usage", 'memory'), ("Disk I/O", 'disk_io')):
+            if key in metrics:
+                progress.add_task(label, total=100, completed=metrics[key])
         
-        progress.update(cpu_task, advance=45)  # 45% CPU
-        progress.update(mem_task, advance=67)  # 67% Memory
-        progress.update(disk_task, advance=disk_info['percent'])
+        progress.add_task("Disk Usage", total=100, completed=disk_info['percent'])
     
     console.print(f"\n[dim]Path analyzed: {os.path.abspath(args.path)}[/dim]")
 
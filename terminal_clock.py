@@ -5,10 +5,48 @@ A lightweight, real-time digital clock for the terminal
 """
 
 import time
+import math
 import sys
 import os
+import signal
 from datetime import datetime
 
+try:
+    import select
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+
+# ANSI sequences for drawing the clock in place
+CLEAR_HOME = "\x1b[2J\x1b[3J\x1b[H"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+
+# Each glyph is 5 columns wide plus a 1 column gap
+GLYPH_WIDTH = 6
+GLYPH_HEIGHT = 7
+TIME_FORMAT_LEN = len("HH:MM:SS")
+FOOTER = "Press Q or Ctrl+C to exit"
+
+# Rendered rows keyed by text: "HH:MM:" prefixes, "SS" suffixes and whole frames
+_PREFIX_ROWS = {}
+_SUFFIX_ROWS = {}
+_FRAME_CACHE = {}
+FRAME_CACHE_SIZE = 3600
+
+# Terminal size, probed once here and re-read only after SIGWINCH marks it
+# stale (or every few ticks where there is no SIGWINCH)
+try:
+    _terminal_size = tuple(os.get_terminal_size())
+    _have_tty = True
+except OSError:
+    # Not a terminal (e.g. piped output); the size can never change
+    _terminal_size = (80, 24)
+    _have_tty = False
+_size_stale = False
+SIZE_POLL_TICKS = 5
+
 # OCR-style ASCII art digits (7-segment display inspired)
 DIGITS = {
     '0': [
@@ -121,90 +159,219 @@ DIGITS = {
     ]
 }
 
+# Bake the gap column into every row so a line is a plain join of glyph rows
+DIGITS = {char: tuple(row + " " for row in rows) for char, rows in DIGITS.items()}
+
+def enable_ansi():
+    """Turn on VT escape processing in the Windows console (no-op elsewhere)"""
+    if os.name == 'nt':
+        # An empty system() call leaves the console in VT mode on Windows 10+
+        os.system('')
+
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    write_output(CLEAR_HOME)
+
+def write_output(text):
+    """Write a whole frame to the terminal in a single write where possible"""
+    sys.stdout.flush()
+    if os.name == 'nt':
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    
+    fd = sys.stdout.fileno()
+    view = memoryview(text.encode('utf-8'))
+    while view:
+        view = view[os.write(fd, view):]
+
+def mark_size_stale(*_):
+    """SIGWINCH handler: re-read the terminal size on the next tick"""
+    global _size_stale
+    _size_stale = True
 
 def get_terminal_size():
     """Get terminal dimensions"""
-    try:
-        columns, rows = os.get_terminal_size()
-        return columns, rows
-    except OSError:
-        return 80, 24  # Default fallback
+    global _terminal_size, _size_stale
+    if _size_stale and _have_tty:
+        _size_stale = False
+        try:
+            _terminal_size = tuple(os.get_terminal_size())
+        except OSError:
+            pass  # Keep the last known size
+    return _terminal_size
+
+def render_glyph_rows(text, cache):
+    """Rows of ASCII art for text, memoized in cache"""
+    rows = cache.get(text)
+    if rows is None:
+        glyphs = [DIGITS.get(char, DIGITS[' ']) for char in text]
+        rows = cache[text] = ["".join(glyph[i] for glyph in glyphs) for i in range(GLYPH_HEIGHT)]
+    return rows
 
 def render_time_display(time_str):
     """Render the time string using ASCII art digits"""
-    lines = [""] * 7
-    
-    for char in time_str:
-        digit_lines = DIGITS.get(char, DIGITS[' '])
-        for i in range(7):
-            lines[i] += digit_lines[i] + " "
-    
+    lines = _FRAME_CACHE.get(time_str)
+    if lines is None:
+        # "HH:MM:" only changes once a minute, so just the seconds are built per frame
+        prefix = render_glyph_rows(time_str[:-2], _PREFIX_ROWS)
+        suffix = render_glyph_rows(time_str[-2:], _SUFFIX_ROWS)
+        if len(_FRAME_CACHE) >= FRAME_CACHE_SIZE:
+            _FRAME_CACHE.clear()
+        lines = _FRAME_CACHE[time_str] = [head + tail for head, tail in zip(prefix, suffix)]
     return lines
 
-def center_text(lines, width):
-    """Center the ASCII art in the terminal"""
-    centered_lines = []
-    for line in lines:
-        padding = (width - len(line)) // 2
-        centered_lines.append(" " * padding + line)
-    return centered_lines
+def clock_origin(width, height):
+    """Top-left screen cell (1-based row, col) of the centered clock"""
+    vertical_padding = max(0, (height - GLYPH_HEIGHT) // 2)
+    padding = max(0, (width - TIME_FORMAT_LEN * GLYPH_WIDTH) // 2)
+    return vertical_padding + 1, padding + 1
+
+def render_full_frame(time_str, width, height):
+    """Escape sequence string that clears the screen and draws the whole clock"""
+    row0, col0 = clock_origin(width, height)
+    parts = [CLEAR_HOME]
+    for r, line in enumerate(render_time_display(time_str)):
+        parts.append(f"\x1b[{row0 + r};{col0}H{line}")
+    
+    # Instructions sit below the clock, as far down as the screen allows
+    footer_row = min(2 * (row0 - 1) + GLYPH_HEIGHT + 2, height)
+    parts.append(f"\x1b[{footer_row};{max(0, (width - 30) // 2) + 1}H{FOOTER}")
+    return "".join(parts)
+
+def render_changed_digits(prev_time_str, time_str, row0, col0):
+    """Escape sequence string redrawing only the glyphs that differ from the previous frame"""
+    parts = []
+    for i, (old, new) in enumerate(zip(prev_time_str, time_str)):
+        if old == new:
+            continue
+        glyph = DIGITS.get(new, DIGITS[' '])
+        col = col0 + i * GLYPH_WIDTH
+        for r in range(GLYPH_HEIGHT):
+            parts.append(f"\x1b[{row0 + r};{col}H{glyph[r]}")
+    return "".join(parts)
+
+def second_ticks(input_fd=None):
+    """Yield None at each wall-clock second boundary, and keys read from input_fd while waiting"""
+    if hasattr(os, 'timerfd_create'):
+        # The kernel re-arms an absolute timer, so ticks stay on the boundaries
+        tfd = os.timerfd_create(time.CLOCK_REALTIME)
+        try:
+            os.timerfd_settime(tfd, flags=os.TFD_TIMER_ABSTIME,
+                               initial=math.floor(time.time()) + 1, interval=1)
+            while True:
+                yield None
+                while True:
+                    if input_fd is None:
+                        os.read(tfd, 8)
+                        break
+                    # The wait for the next tick doubles as the wait for a key
+                    ready, _, _ = select.select([tfd, input_fd], [], [])
+                    if input_fd in ready:
+                        keys = os.read(input_fd, 32)
+                        if not keys:
+                            input_fd = None
+                        else:
+                            yield keys
+                    if tfd in ready:
+                        os.read(tfd, 8)
+                        break
+        finally:
+            os.close(tfd)
+    else:
+        deadline = math.floor(time.time()) + 1
+        while True:
+            yield None
+            delay = deadline - time.time()
+            if delay < -1:
+                # Resync after a suspend or clock jump instead of replaying missed ticks
+                deadline = math.floor(time.time())
+            while delay > 0:
+                if input_fd is None:
+                    time.sleep(delay)
+                else:
+                    ready, _, _ = select.select([input_fd], [], [], delay)
+                    if ready:
+                        keys = os.read(input_fd, 32)
+                        if not keys:
+                            input_fd = None
+                        else:
+                            yield keys
+                delay = deadline - time.time()
+            deadline += 1
 
 def display_clock():
     """Main clock display function"""
+    prev_time_str = None
+    prev_size = None
+    
+    ticks = 0
+    
+    has_sigwinch = hasattr(signal, 'SIGWINCH')
+    if has_sigwinch:
+        signal.signal(signal.SIGWINCH, mark_size_stale)
+    
+    # cbreak keeps Ctrl+C working while single keys arrive without Enter
+    input_fd = None
+    old_settings = None
+    if termios is not None and sys.stdin.isatty():
+        input_fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(input_fd)
+        tty.setcbreak(input_fd)
+    
     try:
-        while True:
+        write_output(HIDE_CURSOR)
+        for keys in second_ticks(input_fd):
+            if keys is not None:
+                if b'q' in keys.lower():
+                    break
+                continue
+            
             # Get current time
             now = datetime.now()
             time_str = now.strftime("%H:%M:%S")
             
-            # Clear screen and get terminal size
-            clear_screen()
-            width, height = get_terminal_size()
-            
-            # Render the time
-            time_lines = render_time_display(time_str)
-            centered_lines = center_text(time_lines, width)
-            
-            # Calculate vertical centering
-            vertical_padding = (height - len(centered_lines)) // 2
+            # Full redraw on the first frame and after a resize, otherwise
+            # only the digits that changed since the last tick
+            if not has_sigwinch and ticks % SIZE_POLL_TICKS == 0:
+                mark_size_stale()
+            ticks += 1
+            size = get_terminal_size()
+            if size != prev_size:
+                output = render_full_frame(time_str, *size)
+                row0, col0 = clock_origin(*size)
+                prev_size = size
+            else:
+                output = render_changed_digits(prev_time_str, time_str, row0, col0)
+            prev_time_str = time_str
             
-            # Print vertical padding
-            for _ in range(vertical_padding):
-                print()
-            
-            # Print the centered clock
-            for line in centered_lines:
-                print(line)
-            
-            # Print some vertical padding at bottom
-            for _ in range(vertical_padding):
-                print()
-            
-            # Print instructions at bottom
-            print(f"\n{' ' * ((width - 30) // 2)}Press Ctrl+C to exit")
-            
-            # Wait for next second
-            time.sleep(1)
+            write_output(output)
             
     except KeyboardInterrupt:
-        clear_screen()
-        print("\nClock terminated. Goodbye!")
-        sys.exit(0)
+        pass
     except Exception as e:
         clear_screen()
         print(f"Error: {e}")
         sys.exit(1)
+    finally:
+        if old_settings is not None:
+            termios.tcsetattr(input_fd, termios.TCSADRAIN, old_settings)
+        sys.stdout.write(SHOW_CURSOR)
+        sys.stdout.flush()
+    
+    clear_screen()
+    print("\nClock terminated. Goodbye!")
+    sys.exit(0)
 
 def main():
     """Entry point for the clock application"""
+    enable_ansi()
+    
     # Print welcome message
     clear_screen()
     print("Terminal Digital Clock")
     print("=====================")
-    print("Starting clock... Press Ctrl+C to exit")
+    print("Starting clock... Press Q or Ctrl+C to exit")
     time.sleep(1)
     
     # Start the clock display
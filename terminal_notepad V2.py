@@ -24,12 +24,49 @@ Controls:
 - Home/End: Line navigation
 """
 
+import codecs
 import curses
+import mmap
 import os
+import shutil
 import sys
+import tempfile
+import time
 import re
-from typing import List, Optional, Dict, Tuple
+import unicodedata
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple, Callable
 import argparse
+from array import array
+
+
+def char_width(char: str) -> int:
+    """Terminal columns taken by char: 0 for combining marks, 2 for wide CJK/emoji."""
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+
+
+def display_width(text: str) -> int:
+    """Terminal columns taken by text."""
+    return len(text) if text.isascii() else sum(map(char_width, text))
+
+
+@lru_cache(maxsize=4096)
+def clip_to_width(line: str, width: int) -> str:
+    """Cut a line down to at most width columns."""
+    if line.isascii():
+        return line[:width]
+    if display_width(line) <= width:
+        return line
+    
+    cols = 0
+    for i, char in enumerate(line):
+        cols += char_width(char)
+        if cols > width:
+            return line[:i]
+    return line
 
 
 class SyntaxHighlighter:
@@ -79,6 +116,19 @@ class SyntaxHighlighter:
                 (r'\[.*?\]\(.*?\)', 1),  # Links
             ]
         }
+        
+        # One alternation per file type: the first branch that matches at a
+        # position wins, so tokens come out ordered and non-overlapping
+        self.compiled = {}
+        self.group_color = {}
+        for file_type, patterns in self.patterns.items():
+            self.compiled[file_type] = re.compile(
+                "|".join(f"(?P<g{i}>{pattern})" for i, (pattern, _) in enumerate(patterns)),
+                re.MULTILINE)
+            self.group_color[file_type] = {f"g{i}": color for i, (_, color) in enumerate(patterns)}
+        
+        # Lines are immutable strs, so an edited line is simply a new key
+        self.highlight_cached = lru_cache(maxsize=4096)(self.highlight_line)
     
     def get_file_type(self, filename: str) -> str:
         """Determine file type from extension."""
@@ -98,32 +148,19 @@ class SyntaxHighlighter:
     
     def highlight_line(self, line: str, file_type: str) -> List[Tuple[str, int]]:
         """Return list of (text, color_pair) tuples for a line."""
-        if file_type not in self.patterns:
+        regex = self.compiled.get(file_type)
+        if regex is None:
             return [(line, 0)]
         
+        group_color = self.group_color[file_type]
         result = []
         pos = 0
         
-        # Find all matches for all patterns
-        matches = []
-        for pattern, color in self.patterns[file_type]:
-            for match in re.finditer(pattern, line, re.MULTILINE):
-                matches.append((match.start(), match.end(), color))
-        
-        # Sort matches by position
-        matches.sort(key=lambda x: x[0])
-        
-        # Remove overlapping matches (keep first)
-        filtered = []
-        for start, end, color in matches:
-            if not any(s <= start < e for s, e, _ in filtered):
-                filtered.append((start, end, color))
-        
-        # Build result
-        for start, end, color in filtered:
+        for match in regex.finditer(line):
+            start, end = match.span()
             if start > pos:
                 result.append((line[pos:start], 0))
-            result.append((line[start:end], color))
+            result.append((line[start:end], group_color[match.lastgroup]))
             pos = end
         
         if pos < len(line):
@@ -150,34 +187,31 @@ class SearchManager:
         if not query:
             return
         
-        pattern = query if case_sensitive else query.lower()
-        
-        for line_num, line in enumerate(lines):
-            search_line = line if case_sensitive else line.lower()
-            pos = 0
-            while True:
-                pos = search_line.find(pattern, pos)
-                if pos == -1:
-                    break
-                self.matches.append((line_num, pos, pos + len(query)))
-                pos += 1
+        regex = re.compile(re.escape(query), 0 if case_sensitive else re.IGNORECASE)
+        self.matches = [(line_num, match.start(), match.end())
+                        for line_num, line in enumerate(lines)
+                        for match in regex.finditer(line)]
+    
+    def refine(self, lines: List[str], query: str):
+        """Search for a query extending the last one, rescanning only lines that matched it."""
+        regex = re.compile(re.escape(query), 0 if self.case_sensitive else re.IGNORECASE)
+        candidates = dict.fromkeys(line_num for line_num, _, _ in self.matches)
+        self.query = query
+        self.matches = [(line_num, match.start(), match.end())
+                        for line_num in candidates
+                        for match in regex.finditer(lines[line_num])]
     
     def next_match(self, current_line: int, current_col: int) -> Optional[Tuple[int, int]]:
         """Find next match after current position."""
         if not self.matches:
             return None
         
-        for i, (line, start, end) in enumerate(self.matches):
-            if line > current_line or (line == current_line and start > current_col):
-                self.current_match = i
-                return (line, start)
-        
-        # Wrap to beginning
-        if self.matches:
-            self.current_match = 0
-            return (self.matches[0][0], self.matches[0][1])
-        
-        return None
+        # Matches are sorted; sys.maxsize puts a match starting at current_col before the key
+        i = bisect_right(self.matches, (current_line, current_col, sys.maxsize))
+        if i == len(self.matches):
+            i = 0  # Wrap to beginning
+        self.current_match = i
+        return self.matches[i][:2]
     
     def get_current_match(self) -> Optional[Tuple[int, int, int]]:
         """Get current match info."""
@@ -230,23 +264,37 @@ class Theme:
         }
         self.current_theme = 'default'
         self.color_pairs = {}
+        self.attrs = {}
     
     def init_colors(self):
-        """Initialize color pairs."""
+        """Initialize color pairs for every theme once, so switching themes only changes the lookup."""
+        if self.color_pairs:
+            return
         curses.start_color()
+        try:
+            # Unstyled cells keep the terminal's own colors instead of being repainted
+            curses.use_default_colors()
+        except curses.error:
+            pass
         pair_num = 1
         
         for theme_name, theme in self.themes.items():
             self.color_pairs[theme_name] = {}
+            self.attrs[theme_name] = {}
             for element, (fg, bg) in theme.items():
                 curses.init_pair(pair_num, fg, bg)
                 self.color_pairs[theme_name][element] = pair_num
+                self.attrs[theme_name][element] = curses.color_pair(pair_num)
                 pair_num += 1
     
     def get_color(self, element: str) -> int:
         """Get color pair for element in current theme."""
         return self.color_pairs[self.current_theme].get(element, 0)
     
+    def get_attr(self, element: str) -> int:
+        """Get the color pair attribute for element in current theme."""
+        return self.attrs[self.current_theme].get(element, 0)
+    
     def next_theme(self):
         """Switch to next theme."""
         themes = list(self.themes.keys())
@@ -254,19 +302,269 @@ class Theme:
         self.current_theme = themes[(current_idx + 1) % len(themes)]
 
 
+class GapLine:
+    """A line being edited, split at the cursor so keystrokes only touch the gap."""
+    
+    __slots__ = ('before', 'after', '_text')
+    
+    def __init__(self, text: str):
+        self.before: List[str] = list(text)
+        self.after: List[str] = []  # Characters after the gap, last one first
+        self._text: Optional[str] = text
+    
+    def __len__(self) -> int:
+        return len(self.before) + len(self.after)
+    
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = ''.join(self.before) + ''.join(reversed(self.after))
+        return self._text
+    
+    def move_gap(self, pos: int):
+        """Shift characters across the gap until it sits at pos."""
+        while len(self.before) > pos:
+            self.after.append(self.before.pop())
+        while len(self.before) < pos and self.after:
+            self.before.append(self.after.pop())
+    
+    def insert(self, pos: int, char: str):
+        """Insert char at pos."""
+        self.move_gap(pos)
+        self.before.append(char)
+        self._text = None
+    
+    def insert_text(self, pos: int, text: str):
+        """Insert text at pos."""
+        self.move_gap(pos)
+        self.before.extend(text)
+        self._text = None
+    
+    def delete_before(self, pos: int):
+        """Remove the character before pos."""
+        self.move_gap(pos)
+        self.before.pop()
+        self._text = None
+    
+    def delete_at(self, pos: int):
+        """Remove the character at pos."""
+        self.move_gap(pos)
+        self.after.pop()
+        self._text = None
+
+
+class LineRope:
+    """Lines kept in chunks, so inserting or deleting one only shifts its own chunk."""
+    
+    __slots__ = ('chunks', 'length', 'tree', 'top_step')
+    
+    CHUNK_SIZE = 1024
+    # Below this many lines a plain list is faster
+    MIN_LINES = 10_000
+    
+    def __init__(self, lines):
+        lines = list(lines)
+        size = self.CHUNK_SIZE
+        self.chunks: List[List] = [lines[i:i + size] for i in range(0, len(lines), size)] or [[]]
+        self.length = len(lines)
+        self.rebuild_index()
+    
+    def rebuild_index(self):
+        """Recount the Fenwick tree of chunk lengths after chunks are split or removed."""
+        count = len(self.chunks)
+        tree = [0] * (count + 1)
+        for k, chunk in enumerate(self.chunks, 1):
+            tree[k] += len(chunk)
+            parent = k + (k & -k)
+            if parent <= count:
+                tree[parent] += tree[k]
+        self.tree = tree
+        self.top_step = 1 << (count.bit_length() - 1)
+    
+    def add_to_index(self, k: int, delta: int):
+        """Adjust the recorded length of chunk k by delta."""
+        k += 1
+        tree = self.tree
+        while k < len(tree):
+            tree[k] += delta
+            k += k & -k
+    
+    def locate(self, i: int) -> Tuple[List, int, int]:
+        """(chunk, chunk index, offset in chunk) holding line i."""
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("line index out of range")
+        
+        # Walk down the tree to the last chunk starting at or before line i
+        tree = self.tree
+        count = len(self.chunks)
+        k = 0
+        step = self.top_step
+        while step:
+            if k + step <= count and tree[k + step] <= i:
+                k += step
+                i -= tree[k]
+            step >>= 1
+        return self.chunks[k], k, i
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __getitem__(self, i: int):
+        chunk, _, offset = self.locate(i)
+        return chunk[offset]
+    
+    def __setitem__(self, i: int, line):
+        chunk, _, offset = self.locate(i)
+        chunk[offset] = line
+    
+    def __delitem__(self, i: int):
+        chunk, k, offset = self.locate(i)
+        del chunk[offset]
+        self.length -= 1
+        if not chunk and len(self.chunks) > 1:
+            del self.chunks[k]
+            self.rebuild_index()
+        else:
+            self.add_to_index(k, -1)
+    
+    def insert(self, i: int, line):
+        if i < 0:
+            i = max(0, i + self.length)
+        if i >= self.length:
+            k = len(self.chunks) - 1
+            chunk = self.chunks[k]
+            offset = len(chunk)
+        else:
+            chunk, k, offset = self.locate(i)
+        chunk.insert(offset, line)
+        self.length += 1
+        if len(chunk) > 2 * self.CHUNK_SIZE:
+            self.chunks[k:k + 1] = [chunk[:self.CHUNK_SIZE], chunk[self.CHUNK_SIZE:]]
+            self.rebuild_index()
+        else:
+            self.add_to_index(k, 1)
+    
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+
+class MappedLines:
+    """Lines of a memory-mapped file, decoded the first time each one is read."""
+    
+    __slots__ = ('mm', 'starts', 'ends', 'lines')
+    
+    CHUNK_SIZE = 1 << 20
+    # Every boundary str.splitlines() splits on, as the UTF-8 bytes encoding it
+    LINE_BREAK = re.compile(rb'\r\n|[\n\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]')
+    # The boundaries other than \n and \r\n, bar a lone \r
+    RARE_BREAKS = '\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+    
+    def __init__(self, mm: mmap.mmap):
+        self.mm = mm
+        
+        # The whole file is checked up front so bad UTF-8 fails the load just
+        # as it does for a file read in one piece; the decoded text is thrown
+        # away, and counting newlines runs in C
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        count = 0
+        rare = False
+        for offset in range(0, len(mm), self.CHUNK_SIZE):
+            chunk = mm[offset:offset + self.CHUNK_SIZE]
+            try:
+                text = decoder.decode(chunk, final=offset + self.CHUNK_SIZE >= len(mm))
+            except UnicodeDecodeError as e:
+                # Give the position in the file, not in this chunk
+                base = offset + len(chunk) - len(e.object)
+                raise UnicodeDecodeError(e.encoding, mm[:base + e.end], base + e.start,
+                                         base + e.end, e.reason) from None
+            count += text.count('\n')
+            rare = (rare or text.count('\r') != text.count('\r\n')
+                    or any(c in text for c in self.RARE_BREAKS))
+        if rare:  # Lines end at more than \n, so count them one by one
+            count = sum(1 for _ in self.LINE_BREAK.finditer(mm))
+        tail = mm[-3:]
+        if not any(match.end() == len(tail) for match in self.LINE_BREAK.finditer(tail)):
+            count += 1  # No trailing line break
+        
+        # Where each line starts and ends is only worked out as far down the
+        # file as has actually been read
+        self.starts = array('q', [0])
+        self.ends = array('q')
+        
+        # Each entry is a decoded str or the index of a line still in the map
+        self.lines = LineRope(range(count)) if count > LineRope.MIN_LINES else list(range(count))
+    
+    def decode(self, index: int) -> str:
+        """Decode line index straight from the map."""
+        starts, ends = self.starts, self.ends
+        while len(ends) <= index:
+            match = self.LINE_BREAK.search(self.mm, starts[-1])
+            if match:
+                ends.append(match.start())
+                starts.append(match.end())
+            else:
+                ends.append(len(self.mm))
+                starts.append(len(self.mm))
+        return self.mm[starts[index]:ends[index]].decode('utf-8')
+    
+    def __len__(self) -> int:
+        return len(self.lines)
+    
+    def __getitem__(self, i: int):
+        line = self.lines[i]
+        if isinstance(line, int):
+            line = self.lines[i] = self.decode(line)
+        return line
+    
+    def __setitem__(self, i: int, line):
+        self.lines[i] = line
+    
+    def __delitem__(self, i: int):
+        del self.lines[i]
+    
+    def insert(self, i: int, line):
+        self.lines.insert(i, line)
+    
+    def __iter__(self):
+        # Whole-buffer passes (save, search) decode without keeping the result
+        for line in self.lines:
+            yield self.decode(line) if isinstance(line, int) else line
+
+
 class TextBuffer:
     """Enhanced text buffer with search and highlighting support."""
     
+    __slots__ = ('filename', 'lines', 'edit_y', 'cursor_x', 'cursor_y', 'scroll_y', 'modified', 'file_type',
+                 'dirty_lines', 'dirty_from', 'display_name', 'display_name_key', 'on_disk')
+    
+    # Files at least this big are memory-mapped and decoded lazily
+    MMAP_THRESHOLD = 1 << 20
+    
     def __init__(self, filename: Optional[str] = None):
         self.filename = filename
-        self.lines: List[str] = [""]
+        # Plain strs, except the line being typed into, which is a GapLine
+        self.lines: List = [""]
+        self.edit_y: Optional[int] = None
         self.cursor_x = 0
         self.cursor_y = 0
         self.scroll_y = 0
         self.modified = False
         self.file_type = 'text'
         
-        if filename and os.path.exists(filename):
+        # Lines edited since the last frame, plus the first line of a region
+        # (through the end of the buffer) shifted by inserted/removed lines
+        self.dirty_lines = set()
+        self.dirty_from: Optional[int] = 0
+        
+        # Tab label and the (filename, modified) it was built from
+        self.display_name = ""
+        self.display_name_key = None
+        
+        # Whether filename was found when loading, as opposed to a new file
+        self.on_disk = False
+        if filename:
             self.load_file()
         
         if filename:
@@ -275,14 +573,28 @@ class TextBuffer:
     def load_file(self):
         """Load file content into buffer."""
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.lines = content.splitlines() if content else [""]
-                if not self.lines:
-                    self.lines = [""]
+            # One open answers whether the file exists, how big it is and what it holds
+            with open(self.filename, 'rb') as f:
+                self.on_disk = True
+                if os.fstat(f.fileno()).st_size >= self.MMAP_THRESHOLD:
+                    self.lines = MappedLines(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                else:
+                    content = f.read().decode('utf-8')
+                    self.lines = content.splitlines() if content else [""]
+                    if not self.lines:
+                        self.lines = [""]
+                    elif len(self.lines) > LineRope.MIN_LINES:
+                        self.lines = LineRope(self.lines)
+            self.edit_y = None
             self.modified = False
+            self.mark_dirty_from(0)
+        except FileNotFoundError:
+            pass  # A new file
         except Exception as e:
+            # The file is there but unreadable; only a missing one is a new file
+            self.on_disk = True
             self.lines = [f"Error loading file: {str(e)}"]
+            self.edit_y = None
     
     def save_file(self, filename: Optional[str] = None):
         """Save buffer content to file."""
@@ -293,29 +605,88 @@ class TextBuffer:
         if not self.filename:
             return False
         
+        self.flush_edits()
+        # Stream into a fresh sibling of the real file (not a symlink to it)
+        # and swap it in, so a failed save leaves the original intact
+        target = os.path.realpath(self.filename)
+        tmp_name = None
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(self.lines))
+            fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(target),
+                                            prefix='.' + os.path.basename(target) + '.')
+            with open(fd, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                lines = iter(self.lines)
+                f.write(next(lines, ''))
+                for line in lines:
+                    f.write('\n')
+                    f.write(line)
+            try:
+                shutil.copymode(target, tmp_name)
+            except FileNotFoundError:
+                # A new file gets the permissions open() would have given it
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_name, 0o666 & ~umask)
+            os.replace(tmp_name, target)
             self.modified = False
             return True
         except Exception:
+            if tmp_name is not None:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
             return False
     
+    def mark_dirty_from(self, line_num: int):
+        """Mark every line from line_num to the end of the buffer for redraw."""
+        if self.dirty_from is None or line_num < self.dirty_from:
+            self.dirty_from = line_num
+    
+    def clear_dirty(self):
+        """Forget pending redraws once the screen is up to date."""
+        self.dirty_lines.clear()
+        self.dirty_from = None
+    
+    def flush_edits(self):
+        """Turn the line being edited back into a plain str."""
+        if self.edit_y is not None:
+            self.lines[self.edit_y] = str(self.lines[self.edit_y])
+            self.edit_y = None
+    
+    def edit_line(self) -> GapLine:
+        """The cursor line as a GapLine, flushing any other line being edited."""
+        if self.edit_y != self.cursor_y:
+            self.flush_edits()
+            self.lines[self.cursor_y] = GapLine(self.lines[self.cursor_y])
+            self.edit_y = self.cursor_y
+        return self.lines[self.cursor_y]
+    
     def insert_char(self, char: str):
         """Insert character at cursor position."""
-        line = self.lines[self.cursor_y]
-        self.lines[self.cursor_y] = line[:self.cursor_x] + char + line[self.cursor_x:]
+        self.edit_line().insert(self.cursor_x, char)
+        self.dirty_lines.add(self.cursor_y)
         self.cursor_x += 1
         self.modified = True
     
+    def insert_str(self, text: str):
+        """Insert text without line breaks at cursor position."""
+        if not text:
+            return
+        self.edit_line().insert_text(self.cursor_x, text)
+        self.dirty_lines.add(self.cursor_y)
+        self.cursor_x += len(text)
+        self.modified = True
+    
     def delete_char(self):
         """Delete character before cursor (backspace)."""
         if self.cursor_x > 0:
-            line = self.lines[self.cursor_y]
-            self.lines[self.cursor_y] = line[:self.cursor_x-1] + line[self.cursor_x:]
+            self.edit_line().delete_before(self.cursor_x)
+            self.dirty_lines.add(self.cursor_y)
             self.cursor_x -= 1
             self.modified = True
         elif self.cursor_y > 0:
+            self.flush_edits()
+            self.mark_dirty_from(self.cursor_y - 1)
             self.cursor_x = len(self.lines[self.cursor_y - 1])
             self.lines[self.cursor_y - 1] += self.lines[self.cursor_y]
             del self.lines[self.cursor_y]
@@ -324,37 +695,54 @@ class TextBuffer:
     
     def delete_forward(self):
         """Delete character at cursor (delete key)."""
-        line = self.lines[self.cursor_y]
-        if self.cursor_x < len(line):
-            self.lines[self.cursor_y] = line[:self.cursor_x] + line[self.cursor_x+1:]
+        if self.cursor_x < len(self.lines[self.cursor_y]):
+            self.edit_line().delete_at(self.cursor_x)
+            self.dirty_lines.add(self.cursor_y)
             self.modified = True
         elif self.cursor_y < len(self.lines) - 1:
+            self.flush_edits()
+            self.mark_dirty_from(self.cursor_y)
             self.lines[self.cursor_y] += self.lines[self.cursor_y + 1]
             del self.lines[self.cursor_y + 1]
             self.modified = True
     
     def insert_newline(self):
         """Insert new line at cursor position."""
+        self.flush_edits()
         line = self.lines[self.cursor_y]
         self.lines[self.cursor_y] = line[:self.cursor_x]
         self.lines.insert(self.cursor_y + 1, line[self.cursor_x:])
+        self.mark_dirty_from(self.cursor_y)
         self.cursor_y += 1
         self.cursor_x = 0
         self.modified = True
     
     def move_cursor(self, dx: int, dy: int, max_x: int, max_y: int):
         """Move cursor with bounds checking."""
-        new_y = max(0, min(len(self.lines) - 1, self.cursor_y + dy))
-        new_x = max(0, min(len(self.lines[new_y]), self.cursor_x + dx))
+        lines = self.lines
+        new_y = self.cursor_y + dy
+        if new_y < 0:
+            new_y = 0
+        elif new_y >= len(lines):
+            new_y = len(lines) - 1
+        
+        new_x = self.cursor_x + dx
+        if new_x < 0:
+            new_x = 0
+        else:
+            line_len = len(lines[new_y])
+            if new_x > line_len:
+                new_x = line_len
         
         self.cursor_y = new_y
         self.cursor_x = new_x
         
         # Adjust scroll if needed
-        if self.cursor_y < self.scroll_y:
-            self.scroll_y = self.cursor_y
-        elif self.cursor_y >= self.scroll_y + max_y:
-            self.scroll_y = self.cursor_y - max_y + 1
+        scroll_y = self.scroll_y
+        if new_y < scroll_y:
+            self.scroll_y = new_y
+        elif new_y >= scroll_y + max_y:
+            self.scroll_y = new_y - max_y + 1
     
     def goto_line(self, line_num: int, max_y: int):
         """Go to specific line number."""
@@ -368,15 +756,36 @@ class TextBuffer:
         else:
             self.scroll_y = 0
     
+    def move_home(self):
+        """Move cursor to start of line."""
+        self.cursor_x = 0
+    
+    def move_end(self):
+        """Move cursor to end of line."""
+        self.cursor_x = len(self.lines[self.cursor_y])
+    
     def get_display_name(self) -> str:
         """Get display name for tab."""
-        name = os.path.basename(self.filename) if self.filename else "Untitled"
-        return f"*{name}" if self.modified else name
+        key = (self.filename, self.modified)
+        if key != self.display_name_key:
+            name = os.path.basename(self.filename) if self.filename else "Untitled"
+            self.display_name = f"*{name}" if self.modified else name
+            self.display_name_key = key
+        return self.display_name
 
 
 class TerminalNotepad:
     """Enhanced main application class."""
     
+    # Characters past the right edge still fed to the highlighter
+    HIGHLIGHT_LOOKAHEAD = 32
+    
+    # Keys whose handlers read input of their own
+    PROMPT_KEYS = frozenset((6, 7, 15, 19))  # Ctrl+F, Ctrl+G, Ctrl+O, Ctrl+S
+    
+    # Status bar text, filled in by draw_status
+    STATUS_FORMAT = " Ln {line}, Col {col} | {name}{modified} | {file_type} | Theme: {theme}{syntax}"
+    
     def __init__(self, initial_files: List[str] = None):
         self.tabs: List[TextBuffer] = []
         self.current_tab = 0
@@ -386,6 +795,45 @@ class TerminalNotepad:
         self.syntax_enabled = True
         self.search_mode = False
         self.goto_mode = False
+        # What the tab bar and content area were last drawn from; a change
+        # repaints that part
+        self.drawn_tabs = None
+        self.drawn_view = None
+        self.drawn_status = None
+        
+        # Transient status bar message and when (time.monotonic()) it expires
+        self.message: Optional[str] = None
+        self.message_until: Optional[float] = None
+        
+        # Key handlers, called as handler(stdscr, buffer, rows, width) where
+        # rows is the height of the text area
+        self.keymap: Dict[int, Callable] = {
+            14: lambda *_: self.add_tab(),                     # Ctrl+N
+            15: lambda stdscr, *_: self.handle_open(stdscr),   # Ctrl+O
+            19: lambda stdscr, *_: self.handle_save(stdscr),   # Ctrl+S
+            23: lambda *_: self.close_tab(),                   # Ctrl+W
+            6: lambda stdscr, *_: self.handle_search(stdscr),  # Ctrl+F
+            7: lambda stdscr, *_: self.handle_goto(stdscr),    # Ctrl+G
+            20: lambda *_: self.theme.next_theme(),            # Ctrl+T
+            8: lambda *_: self.toggle_syntax(),                # Ctrl+H
+            curses.KEY_F3: lambda _, buffer, rows, width: self.find_next(buffer, rows, width),
+            9: lambda *_: self.switch_tab(1),                  # Tab
+            560: lambda *_: self.switch_tab(-1),               # Ctrl+Left
+            545: lambda *_: self.switch_tab(1),                # Ctrl+Right
+            curses.KEY_UP: lambda _, buffer, rows, width: buffer.move_cursor(0, -1, width, rows),
+            curses.KEY_DOWN: lambda _, buffer, rows, width: buffer.move_cursor(0, 1, width, rows),
+            curses.KEY_LEFT: lambda _, buffer, rows, width: buffer.move_cursor(-1, 0, width, rows),
+            curses.KEY_RIGHT: lambda _, buffer, rows, width: buffer.move_cursor(1, 0, width, rows),
+            curses.KEY_HOME: lambda _, buffer, *__: buffer.move_home(),
+            curses.KEY_END: lambda _, buffer, *__: buffer.move_end(),
+            curses.KEY_PPAGE: lambda _, buffer, rows, width: buffer.move_cursor(0, -rows, width, rows),
+            curses.KEY_NPAGE: lambda _, buffer, rows, width: buffer.move_cursor(0, rows, width, rows),
+            curses.KEY_BACKSPACE: lambda _, buffer, *__: buffer.delete_char(),
+            127: lambda _, buffer, *__: buffer.delete_char(),  # Backspace
+            curses.KEY_DC: lambda _, buffer, *__: buffer.delete_forward(),
+            10: lambda _, buffer, *__: buffer.insert_newline(),  # Enter
+            13: lambda _, buffer, *__: buffer.insert_newline(),
+        }
         
         # Initialize with files or empty tab
         if initial_files:
@@ -411,13 +859,55 @@ class TerminalNotepad:
         if len(self.tabs) > 1:
             self.current_tab = (self.current_tab + direction) % len(self.tabs)
     
+    def toggle_syntax(self):
+        """Turn syntax highlighting on or off."""
+        self.syntax_enabled = not self.syntax_enabled
+    
+    def find_next(self, buffer: TextBuffer, rows: int, width: int):
+        """Jump to the next match of the last search."""
+        if self.search_manager.matches:
+            match = self.search_manager.next_match(buffer.cursor_y, buffer.cursor_x)
+            if match:
+                buffer.cursor_y, buffer.cursor_x = match
+                buffer.move_cursor(0, 0, width, rows)
+    
+    def insert_typed(self, stdscr, buffer: TextBuffer, key: int):
+        """Insert a typed key plus any already queued behind it (a paste) before the next redraw."""
+        chars = [chr(key)]
+        stdscr.nodelay(True)
+        try:
+            while True:
+                key = stdscr.getch()
+                if 32 <= key <= 126:
+                    chars.append(chr(key))
+                elif key == 10 or key == 13:
+                    if chars:
+                        buffer.insert_str(''.join(chars))
+                    buffer.insert_newline()
+                    chars = []
+                else:
+                    if key != -1:
+                        curses.ungetch(key)  # Leave it for the main loop
+                    break
+        finally:
+            stdscr.nodelay(False)
+        
+        if chars:
+            buffer.insert_str(''.join(chars))
+    
     def get_current_buffer(self) -> TextBuffer:
         """Get currently active text buffer."""
         return self.tabs[self.current_tab]
     
     def draw_tabs(self, stdscr, width: int):
         """Draw tab bar at top of screen."""
-        stdscr.attron(curses.color_pair(self.theme.get_color('tab_bar')))
+        tabs_sig = (self.current_tab, tuple((tab.filename, tab.modified) for tab in self.tabs),
+                    width, self.theme.current_theme)
+        if tabs_sig == self.drawn_tabs:
+            return
+        self.drawn_tabs = tabs_sig
+        
+        stdscr.attron(self.theme.get_attr('tab_bar'))
         stdscr.addstr(0, 0, " " * width)
         
         x = 0
@@ -431,17 +921,17 @@ class TerminalNotepad:
             
             # Highlight current tab
             if i == self.current_tab:
-                stdscr.attron(curses.color_pair(self.theme.get_color('active_tab')))
+                stdscr.attron(self.theme.get_attr('active_tab'))
             else:
-                stdscr.attron(curses.color_pair(self.theme.get_color('tab_bar')))
+                stdscr.attron(self.theme.get_attr('tab_bar'))
             
             tab_text = f" {name} "
             if x + len(tab_text) < width:
                 stdscr.addstr(0, x, tab_text)
             x += len(tab_text) + 1
         
-        stdscr.attroff(curses.color_pair(self.theme.get_color('tab_bar')))
-        stdscr.attroff(curses.color_pair(self.theme.get_color('active_tab')))
+        stdscr.attroff(self.theme.get_attr('tab_bar'))
+        stdscr.attroff(self.theme.get_attr('active_tab'))
     
     def draw_content(self, stdscr, height: int, width: int):
         """Draw text content area with syntax highlighting."""
@@ -450,48 +940,69 @@ class TerminalNotepad:
         # Get search highlight info
         search_match = self.search_manager.get_current_match()
         
+        # Scrolling, switching tabs, resizing or restyling shifts every row;
+        # otherwise only the lines edited since the last frame are repainted
+        view = (id(buffer), buffer.scroll_y, height, width, self.syntax_enabled,
+                self.theme.current_theme, search_match)
+        if view != self.drawn_view:
+            self.drawn_view = view
+            buffer.mark_dirty_from(0)
+            stdscr.move(height - 2, 0)
+            stdscr.clrtoeol()
+        dirty_lines = buffer.dirty_lines
+        dirty_from = buffer.dirty_from
+        
+        # Attributes for each highlighter color type, looked up once per frame
+        color_map = [self.theme.get_attr(element)
+                     for element in ('text', 'keyword', 'comment', 'string', 'number', 'special')]
+        search_attr = self.theme.get_attr('search_highlight')
+        
         for i in range(height - 3):
             line_num = buffer.scroll_y + i
+            if line_num not in dirty_lines and (dirty_from is None or line_num < dirty_from):
+                continue
+            
+            stdscr.move(i + 1, 0)
+            stdscr.clrtoeol()
             if line_num < len(buffer.lines):
-                line = buffer.lines[line_num]
+                line = str(buffer.lines[line_num])
+                # Characters that fit on screen; wide ones take two columns
+                visible = len(clip_to_width(line, width))
                 
                 if self.syntax_enabled and buffer.file_type != 'text':
-                    # Apply syntax highlighting
-                    segments = self.syntax_highlighter.highlight_line(line, buffer.file_type)
+                    # Apply syntax highlighting to the visible part, plus enough
+                    # lookahead that tokens crossing the right edge still match
+                    segments = self.syntax_highlighter.highlight_cached(
+                        line[:visible + self.HIGHLIGHT_LOOKAHEAD], buffer.file_type)
                     x = 0
+                    runs = []
                     for text, color_type in segments:
-                        if x >= width:
+                        if x >= visible:
                             break
                         
                         # Get appropriate color
-                        if color_type == 0:
-                            color = self.theme.get_color('text')
-                        elif color_type == 1:
-                            color = self.theme.get_color('keyword')
-                        elif color_type == 2:
-                            color = self.theme.get_color('comment')
-                        elif color_type == 3:
-                            color = self.theme.get_color('string')
-                        elif color_type == 4:
-                            color = self.theme.get_color('number')
-                        elif color_type == 5:
-                            color = self.theme.get_color('special')
-                        else:
-                            color = self.theme.get_color('text')
+                        color = color_map[color_type] if color_type < len(color_map) else color_map[0]
                         
                         # Check for search highlight
                         if (search_match and search_match[0] == line_num and 
                             x <= search_match[1] < x + len(text)):
-                            color = self.theme.get_color('search_highlight')
+                            color = search_attr
                         
-                        stdscr.attron(curses.color_pair(color))
-                        display_text = text[:width - x]
-                        stdscr.addstr(i + 1, x, display_text)
-                        stdscr.attroff(curses.color_pair(color))
+                        # Neighbouring segments in the same color go out in one write
+                        display_text = text[:visible - x]
+                        if runs and runs[-1][1] == color:
+                            runs[-1][0] += display_text
+                        else:
+                            runs.append([display_text, color])
                         x += len(display_text)
+                    
+                    col = 0
+                    for text, color in runs:
+                        stdscr.addstr(i + 1, col, text, color)
+                        col += display_width(text)
                 else:
                     # No highlighting
-                    display_line = line[:width]
+                    display_line = line[:visible]
                     
                     # Check for search highlight
                     if (search_match and search_match[0] == line_num):
@@ -501,49 +1012,52 @@ class TerminalNotepad:
                             if start > 0:
                                 stdscr.addstr(i + 1, 0, display_line[:start])
                             # Match
-                            stdscr.attron(curses.color_pair(self.theme.get_color('search_highlight')))
-                            stdscr.addstr(i + 1, start, display_line[start:min(end, len(display_line))])
-                            stdscr.attroff(curses.color_pair(self.theme.get_color('search_highlight')))
+                            stdscr.addstr(i + 1, display_width(display_line[:start]),
+                                          display_line[start:min(end, len(display_line))], search_attr)
                             # After match
                             if end < len(display_line):
-                                stdscr.addstr(i + 1, end, display_line[end:])
+                                stdscr.addstr(i + 1, display_width(display_line[:end]), display_line[end:])
                         else:
                             stdscr.addstr(i + 1, 0, display_line)
                     else:
                         stdscr.addstr(i + 1, 0, display_line)
-            
-            stdscr.clrtoeol()
+        
+        buffer.clear_dirty()
     
     def draw_status(self, stdscr, height: int, width: int):
         """Draw status bar at bottom."""
         buffer = self.get_current_buffer()
         
-        if self.search_mode:
+        # Everything the status text is built from; skip the rebuild when unchanged
+        status_sig = (buffer.cursor_y, buffer.cursor_x, buffer.filename, buffer.modified,
+                      buffer.file_type, self.theme.current_theme, self.syntax_enabled,
+                      self.message, self.search_mode, self.goto_mode, height, width)
+        if status_sig == self.drawn_status:
+            return
+        self.drawn_status = status_sig
+        
+        if self.message is not None:
+            status = self.message
+        elif self.search_mode:
             status = f" Search: {self.search_manager.query}"
             if self.search_manager.matches:
                 status += f" ({self.search_manager.current_match + 1}/{len(self.search_manager.matches)})"
         elif self.goto_mode:
             status = " Go to line: "
         else:
-            status = f" Ln {buffer.cursor_y + 1}, Col {buffer.cursor_x + 1}"
-            
-            if buffer.filename:
-                status += f" | {buffer.filename}"
-            else:
-                status += " | Untitled"
-            
-            if buffer.modified:
-                status += " [Modified]"
-            
-            status += f" | {buffer.file_type.upper()}"
-            status += f" | Theme: {self.theme.current_theme}"
-            
-            if not self.syntax_enabled:
-                status += " [No Syntax]"
+            status = self.STATUS_FORMAT.format_map({
+                'line': buffer.cursor_y + 1,
+                'col': buffer.cursor_x + 1,
+                'name': buffer.filename or "Untitled",
+                'modified': " [Modified]" if buffer.modified else "",
+                'file_type': buffer.file_type.upper(),
+                'theme': self.theme.current_theme,
+                'syntax': "" if self.syntax_enabled else " [No Syntax]",
+            })
         
-        stdscr.attron(curses.color_pair(self.theme.get_color('status_bar')))
+        stdscr.attron(self.theme.get_attr('status_bar'))
         stdscr.addstr(height - 1, 0, status.ljust(width)[:width])
-        stdscr.attroff(curses.color_pair(self.theme.get_color('status_bar')))
+        stdscr.attroff(self.theme.get_attr('status_bar'))
     
     def handle_search(self, stdscr):
         """Handle search input."""
@@ -552,28 +1066,48 @@ class TerminalNotepad:
         
         query = ""
         self.search_mode = True
+        buffer.flush_edits()
+        
+        # Matches for the query typed so far; they only replace the real
+        # search results once Enter is pressed
+        preview = SearchManager()
+        
+        # Nothing but the prompt changes while typing, so draw the rest once
+        self.draw_tabs(stdscr, width)
+        self.draw_content(stdscr, height, width)
+        
+        # getch gives up after this long without a key, which is the pause
+        # that triggers a search
+        stdscr.timeout(100)
         
         while True:
-            # Update display
-            stdscr.clear()
-            self.draw_tabs(stdscr, width)
-            self.draw_content(stdscr, height, width)
-            
             # Show search prompt
             prompt = f" Search: {query}"
-            stdscr.attron(curses.color_pair(self.theme.get_color('status_bar')))
-            stdscr.addstr(height - 1, 0, prompt.ljust(width)[:width])
-            stdscr.attroff(curses.color_pair(self.theme.get_color('status_bar')))
+            status = prompt
+            if query and preview.query == query:
+                status += f"  ({len(preview.matches)} matches)"
+            stdscr.attron(self.theme.get_attr('status_bar'))
+            stdscr.addstr(height - 1, 0, status.ljust(width)[:width])
+            stdscr.attroff(self.theme.get_attr('status_bar'))
             stdscr.move(height - 1, len(prompt))
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             
             key = stdscr.getch()
             
-            if key == 27:  # Escape
+            if key == -1:  # Typing paused: search what has been typed so far
+                if query and preview.query != query:
+                    if preview.query and query.startswith(preview.query):
+                        preview.refine(buffer.lines, query)
+                    else:
+                        preview.search(buffer.lines, query)
+            elif key == 27:  # Escape
                 break
             elif key == 10 or key == 13:  # Enter
                 if query:
-                    self.search_manager.search(buffer.lines, query)
+                    if preview.query != query:
+                        preview.search(buffer.lines, query)
+                    self.search_manager = preview
                     if self.search_manager.matches:
                         match = self.search_manager.next_match(buffer.cursor_y, buffer.cursor_x)
                         if match:
@@ -586,6 +1120,7 @@ class TerminalNotepad:
                 query += chr(key)
         
         self.search_mode = False
+        self.drawn_status = None  # The prompt was drawn over the status bar
     
     def handle_goto(self, stdscr):
         """Handle go to line input."""
@@ -594,20 +1129,22 @@ class TerminalNotepad:
         
         line_str = ""
         self.goto_mode = True
+        # Wait for each key, whatever timeout the main loop left set
+        stdscr.timeout(-1)
         
         while True:
             # Update display
-            stdscr.clear()
             self.draw_tabs(stdscr, width)
             self.draw_content(stdscr, height, width)
             
             # Show goto prompt
             prompt = f" Go to line: {line_str}"
-            stdscr.attron(curses.color_pair(self.theme.get_color('status_bar')))
+            stdscr.attron(self.theme.get_attr('status_bar'))
             stdscr.addstr(height - 1, 0, prompt.ljust(width)[:width])
-            stdscr.attroff(curses.color_pair(self.theme.get_color('status_bar')))
+            stdscr.attroff(self.theme.get_attr('status_bar'))
             stdscr.move(height - 1, len(prompt))
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             
             key = stdscr.getch()
             
@@ -626,6 +1163,12 @@ class TerminalNotepad:
                 line_str += chr(key)
         
         self.goto_mode = False
+        self.drawn_status = None  # The prompt was drawn over the status bar
+    
+    def show_message(self, message: str, seconds: float = 1.0):
+        """Show message in the status bar for a while, without blocking input."""
+        self.message = message
+        self.message_until = time.monotonic() + seconds
     
     def handle_save(self, stdscr):
         """Handle save operation."""
@@ -633,8 +1176,11 @@ class TerminalNotepad:
         if not buffer.filename:
             height, width = stdscr.getmaxyx()
             stdscr.addstr(height - 1, 0, "Save as: ".ljust(width))
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             
+            # Wait for the whole answer, whatever timeout the main loop left set
+            stdscr.timeout(-1)
             curses.echo()
             filename = stdscr.getstr(height - 1, 9, width - 9).decode('utf-8')
             curses.noecho()
@@ -643,23 +1189,31 @@ class TerminalNotepad:
                 buffer.filename = filename.strip()
         
         if buffer.save_file():
-            height, width = stdscr.getmaxyx()
-            stdscr.addstr(height - 1, 0, f"Saved: {buffer.filename}".ljust(width))
-            stdscr.refresh()
-            curses.napms(1000)
+            self.show_message(f"Saved: {buffer.filename}")
+        
+        # The prompt above was written over the status bar
+        self.drawn_status = None
     
     def handle_open(self, stdscr):
         """Handle open file operation."""
         height, width = stdscr.getmaxyx()
         stdscr.addstr(height - 1, 0, "Open file: ".ljust(width))
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
         
+        # Wait for the whole answer, whatever timeout the main loop left set
+        stdscr.timeout(-1)
         curses.echo()
         filename = stdscr.getstr(height - 1, 11, width - 11).decode('utf-8')
         curses.noecho()
         
-        if filename.strip() and os.path.exists(filename.strip()):
-            self.add_tab(filename.strip())
+        filename = filename.strip()
+        if filename:
+            buffer = TextBuffer(filename)
+            if buffer.on_disk:
+                self.tabs.append(buffer)
+                self.current_tab = len(self.tabs) - 1
+        self.drawn_status = None
     
     def run(self, stdscr):
         """Main application loop."""
@@ -669,11 +1223,13 @@ class TerminalNotepad:
         # Configure curses
         curses.curs_set(1)
         stdscr.keypad(True)
-        stdscr.timeout(100)
+        
+        # Only re-read when curses reports a resize
+        height, width = stdscr.getmaxyx()
         
         while True:
-            height, width = stdscr.getmaxyx()
-            stdscr.clear()
+            if self.message_until is not None and time.monotonic() >= self.message_until:
+                self.message = self.message_until = None
             
             # Draw interface
             self.draw_tabs(stdscr, width)
@@ -684,72 +1240,52 @@ class TerminalNotepad:
             buffer = self.get_current_buffer()
             cursor_screen_y = buffer.cursor_y - buffer.scroll_y + 1
             if 0 <= cursor_screen_y < height - 2:
-                stdscr.move(cursor_screen_y, min(buffer.cursor_x, width - 1))
+                line = str(buffer.lines[buffer.cursor_y])
+                stdscr.move(cursor_screen_y, min(display_width(line[:buffer.cursor_x]), width - 1))
             
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             
-            # Handle input
+            # Block until a key (or KEY_RESIZE) arrives, waking early only to
+            # take down a status message
+            if self.message_until is None:
+                stdscr.timeout(-1)
+            else:
+                stdscr.timeout(max(1, int((self.message_until - time.monotonic()) * 1000)))
+            
+            # Handle input, then every key already queued behind it (autorepeat,
+            # a burst of resizes) before drawing again
             try:
                 key = stdscr.getch()
             except:
                 continue
             
-            if key == -1:
-                continue
-            elif key == 17:  # Ctrl+Q
-                break
-            elif key == 14:  # Ctrl+N
-                self.add_tab()
-            elif key == 15:  # Ctrl+O
-                self.handle_open(stdscr)
-            elif key == 19:  # Ctrl+S
-                self.handle_save(stdscr)
-            elif key == 23:  # Ctrl+W
-                self.close_tab()
-            elif key == 6:   # Ctrl+F
-                self.handle_search(stdscr)
-            elif key == 7:   # Ctrl+G
-                self.handle_goto(stdscr)
-            elif key == 20:  # Ctrl+T
-                self.theme.next_theme()
-            elif key == 8:   # Ctrl+H
-                self.syntax_enabled = not self.syntax_enabled
-            elif key == curses.KEY_F3:  # F3 - Find next
-                if self.search_manager.matches:
-                    match = self.search_manager.next_match(buffer.cursor_y, buffer.cursor_x)
-                    if match:
-                        buffer.cursor_y, buffer.cursor_x = match
-                        buffer.move_cursor(0, 0, width, height - 3)
-            elif key == 9:   # Tab
-                self.switch_tab(1)
-            elif key == 560:  # Ctrl+Left
-                self.switch_tab(-1)
-            elif key == 545:  # Ctrl+Right
-                self.switch_tab(1)
-            elif key == curses.KEY_UP:
-                buffer.move_cursor(0, -1, width, height - 3)
-            elif key == curses.KEY_DOWN:
-                buffer.move_cursor(0, 1, width, height - 3)
-            elif key == curses.KEY_LEFT:
-                buffer.move_cursor(-1, 0, width, height - 3)
-            elif key == curses.KEY_RIGHT:
-                buffer.move_cursor(1, 0, width, height - 3)
-            elif key == curses.KEY_HOME:
-                buffer.cursor_x = 0
-            elif key == curses.KEY_END:
-                buffer.cursor_x = len(buffer.lines[buffer.cursor_y])
-            elif key == curses.KEY_PPAGE:  # Page Up
-                buffer.move_cursor(0, -(height - 3), width, height - 3)
-            elif key == curses.KEY_NPAGE:  # Page Down
-                buffer.move_cursor(0, height - 3, width, height - 3)
-            elif key == curses.KEY_BACKSPACE or key == 127:
-                buffer.delete_char()
-            elif key == curses.KEY_DC:  # Delete
-                buffer.delete_forward()
-            elif key == 10 or key == 13:  # Enter
-                buffer.insert_newline()
-            elif 32 <= key <= 126:  # Printable characters
-                buffer.insert_char(chr(key))
+            while key != -1:
+                if key == 17:  # Ctrl+Q
+                    return
+                elif key == curses.KEY_RESIZE:
+                    curses.update_lines_cols()
+                    height, width = stdscr.getmaxyx()
+                else:
+                    buffer = self.get_current_buffer()
+                    handler = self.keymap.get(key)
+                    if handler is not None:
+                        prompt = key in self.PROMPT_KEYS
+                        if prompt:
+                            # Never hand the draining zero timeout to a prompt
+                            stdscr.timeout(-1)
+                        handler(stdscr, buffer, height - 3, width)
+                        if prompt:
+                            # A resize while prompting went to the prompt's own input
+                            height, width = stdscr.getmaxyx()
+                    elif 32 <= key <= 126:  # Printable characters
+                        self.insert_typed(stdscr, buffer, key)
+                
+                stdscr.timeout(0)
+                try:
+                    key = stdscr.getch()
+                except:
+                    break
 
 
 def main():
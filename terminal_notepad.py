@@ -18,37 +18,338 @@ Controls:
 - Home/End: Line navigation
 """
 
+import codecs
 import curses
+import mmap
 import os
+import re
+import shutil
 import sys
-from typing import List, Optional
+import tempfile
+import time
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 import argparse
+from array import array
+
+
+def char_width(char: str) -> int:
+    """Terminal columns taken by char: 0 for combining marks, 2 for wide CJK/emoji."""
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+
+
+def display_width(text: str) -> int:
+    """Terminal columns taken by text."""
+    return len(text) if text.isascii() else sum(map(char_width, text))
+
+
+@lru_cache(maxsize=4096)
+def clip_to_width(line: str, width: int) -> str:
+    """Cut a line longer than width columns down to width - 1 columns."""
+    if line.isascii():
+        return line[:width-1] if len(line) > width else line
+    if display_width(line) <= width:
+        return line
+    
+    cols = 0
+    for i, char in enumerate(line):
+        cols += char_width(char)
+        if cols > width - 1:
+            return line[:i]
+    return line
+
+
+class GapLine:
+    """A line being edited, split at the cursor so keystrokes only touch the gap."""
+    
+    __slots__ = ('before', 'after', '_text')
+    
+    def __init__(self, text: str):
+        self.before: List[str] = list(text)
+        self.after: List[str] = []  # Characters after the gap, last one first
+        self._text: Optional[str] = text
+    
+    def __len__(self) -> int:
+        return len(self.before) + len(self.after)
+    
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = ''.join(self.before) + ''.join(reversed(self.after))
+        return self._text
+    
+    def move_gap(self, pos: int):
+        """Shift characters across the gap until it sits at pos."""
+        while len(self.before) > pos:
+            self.after.append(self.before.pop())
+        while len(self.before) < pos and self.after:
+            self.before.append(self.after.pop())
+    
+    def insert(self, pos: int, char: str):
+        """Insert char at pos."""
+        self.move_gap(pos)
+        self.before.append(char)
+        self._text = None
+    
+    def insert_text(self, pos: int, text: str):
+        """Insert text at pos."""
+        self.move_gap(pos)
+        self.before.extend(text)
+        self._text = None
+    
+    def delete_before(self, pos: int):
+        """Remove the character before pos."""
+        self.move_gap(pos)
+        self.before.pop()
+        self._text = None
+    
+    def delete_at(self, pos: int):
+        """Remove the character at pos."""
+        self.move_gap(pos)
+        self.after.pop()
+        self._text = None
+
+
+class LineRope:
+    """Lines kept in chunks, so inserting or deleting one only shifts its own chunk."""
+    
+    __slots__ = ('chunks', 'length', 'tree', 'top_step')
+    
+    CHUNK_SIZE = 1024
+    # Below this many lines a plain list is faster
+    MIN_LINES = 10_000
+    
+    def __init__(self, lines):
+        lines = list(lines)
+        size = self.CHUNK_SIZE
+        self.chunks: List[List] = [lines[i:i + size] for i in range(0, len(lines), size)] or [[]]
+        self.length = len(lines)
+        self.rebuild_index()
+    
+    def rebuild_index(self):
+        """Recount the Fenwick tree of chunk lengths after chunks are split or removed."""
+        count = len(self.chunks)
+        tree = [0] * (count + 1)
+        for k, chunk in enumerate(self.chunks, 1):
+            tree[k] += len(chunk)
+            parent = k + (k & -k)
+            if parent <= count:
+                tree[parent] += tree[k]
+        self.tree = tree
+        self.top_step = 1 << (count.bit_length() - 1)
+    
+    def add_to_index(self, k: int, delta: int):
+        """Adjust the recorded length of chunk k by delta."""
+        k += 1
+        tree = self.tree
+        while k < len(tree):
+            tree[k] += delta
+            k += k & -k
+    
+    def locate(self, i: int) -> Tuple[List, int, int]:
+        """(chunk, chunk index, offset in chunk) holding line i."""
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("line index out of range")
+        
+        # Walk down the tree to the last chunk starting at or before line i
+        tree = self.tree
+        count = len(self.chunks)
+        k = 0
+        step = self.top_step
+        while step:
+            if k + step <= count and tree[k + step] <= i:
+                k += step
+                i -= tree[k]
+            step >>= 1
+        return self.chunks[k], k, i
+    
+    def __len__(self) -> int:
+        return self.length
+    
+    def __getitem__(self, i: int):
+        chunk, _, offset = self.locate(i)
+        return chunk[offset]
+    
+    def __setitem__(self, i: int, line):
+        chunk, _, offset = self.locate(i)
+        chunk[offset] = line
+    
+    def __delitem__(self, i: int):
+        chunk, k, offset = self.locate(i)
+        del chunk[offset]
+        self.length -= 1
+        if not chunk and len(self.chunks) > 1:
+            del self.chunks[k]
+            self.rebuild_index()
+        else:
+            self.add_to_index(k, -1)
+    
+    def insert(self, i: int, line):
+        if i < 0:
+            i = max(0, i + self.length)
+        if i >= self.length:
+            k = len(self.chunks) - 1
+            chunk = self.chunks[k]
+            offset = len(chunk)
+        else:
+            chunk, k, offset = self.locate(i)
+        chunk.insert(offset, line)
+        self.length += 1
+        if len(chunk) > 2 * self.CHUNK_SIZE:
+            self.chunks[k:k + 1] = [chunk[:self.CHUNK_SIZE], chunk[self.CHUNK_SIZE:]]
+            self.rebuild_index()
+        else:
+            self.add_to_index(k, 1)
+    
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from chunk
+
+
+class MappedLines:
+    """Lines of a memory-mapped file, decoded the first time each one is read."""
+    
+    __slots__ = ('mm', 'starts', 'ends', 'lines')
+    
+    CHUNK_SIZE = 1 << 20
+    # Every boundary str.splitlines() splits on, as the UTF-8 bytes encoding it
+    LINE_BREAK = re.compile(rb'\r\n|[\n\r\x0b\x0c\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]')
+    # The boundaries other than \n and \r\n, bar a lone \r
+    RARE_BREAKS = '\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+    
+    def __init__(self, mm: mmap.mmap):
+        self.mm = mm
+        
+        # The whole file is checked up front so bad UTF-8 fails the load just
+        # as it does for a file read in one piece; the decoded text is thrown
+        # away, and counting newlines runs in C
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        count = 0
+        rare = False
+        for offset in range(0, len(mm), self.CHUNK_SIZE):
+            chunk = mm[offset:offset + self.CHUNK_SIZE]
+            try:
+                text = decoder.decode(chunk, final=offset + self.CHUNK_SIZE >= len(mm))
+            except UnicodeDecodeError as e:
+                # Give the position in the file, not in this chunk
+                base = offset + len(chunk) - len(e.object)
+                raise UnicodeDecodeError(e.encoding, mm[:base + e.end], base + e.start,
+                                         base + e.end, e.reason) from None
+            count += text.count('\n')
+            rare = (rare or text.count('\r') != text.count('\r\n')
+                    or any(c in text for c in self.RARE_BREAKS))
+        if rare:  # Lines end at more than \n, so count them one by one
+            count = sum(1 for _ in self.LINE_BREAK.finditer(mm))
+        tail = mm[-3:]
+        if not any(match.end() == len(tail) for match in self.LINE_BREAK.finditer(tail)):
+            count += 1  # No trailing line break
+        
+        # Where each line starts and ends is only worked out as far down the
+        # file as has actually been read
+        self.starts = array('q', [0])
+        self.ends = array('q')
+        
+        # Each entry is a decoded str or the index of a line still in the map
+        self.lines = LineRope(range(count)) if count > LineRope.MIN_LINES else list(range(count))
+    
+    def decode(self, index: int) -> str:
+        """Decode line index straight from the map."""
+        starts, ends = self.starts, self.ends
+        while len(ends) <= index:
+            match = self.LINE_BREAK.search(self.mm, starts[-1])
+            if match:
+                ends.append(match.start())
+                starts.append(match.end())
+            else:
+                ends.append(len(self.mm))
+                starts.append(len(self.mm))
+        return self.mm[starts[index]:ends[index]].decode('utf-8')
+    
+    def __len__(self) -> int:
+        return len(self.lines)
+    
+    def __getitem__(self, i: int):
+        line = self.lines[i]
+        if isinstance(line, int):
+            line = self.lines[i] = self.decode(line)
+        return line
+    
+    def __setitem__(self, i: int, line):
+        self.lines[i] = line
+    
+    def __delitem__(self, i: int):
+        del self.lines[i]
+    
+    def insert(self, i: int, line):
+        self.lines.insert(i, line)
+    
+    def __iter__(self):
+        # Whole-buffer passes (save, search) decode without keeping the result
+        for line in self.lines:
+            yield self.decode(line) if isinstance(line, int) else line
 
 
 class TextBuffer:
     """Manages text content for a single tab."""
     
+    __slots__ = ('filename', 'lines', 'edit_y', 'cursor_x', 'cursor_y', 'scroll_y', 'modified',
+                 'dirty_lines', 'dirty_from', 'display_name', 'display_name_key', 'on_disk')
+    
+    # Files at least this big are memory-mapped and decoded lazily
+    MMAP_THRESHOLD = 1 << 20
+    
     def __init__(self, filename: Optional[str] = None):
         self.filename = filename
-        self.lines: List[str] = [""]
+        # Plain strs, except the line being typed into, which is a GapLine
+        self.lines: List = [""]
+        self.edit_y: Optional[int] = None
         self.cursor_x = 0
         self.cursor_y = 0
         self.scroll_y = 0
         self.modified = False
         
-        if filename and os.path.exists(filename):
+        # Lines edited since the last frame, plus the first line of a region
+        # (through the end of the buffer) shifted by inserted/removed lines
+        self.dirty_lines = set()
+        self.dirty_from: Optional[int] = 0
+        
+        # Tab label and the (filename, modified) it was built from
+        self.display_name = ""
+        self.display_name_key = None
+        
+        # Whether filename was found when loading, as opposed to a new file
+        self.on_disk = False
+        if filename:
             self.load_file()
     
     def load_file(self):
         """Load file content into buffer."""
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                self.lines = f.read().splitlines()
-                if not self.lines:
-                    self.lines = [""]
+            # One open answers whether the file exists, how big it is and what it holds
+            with open(self.filename, 'rb') as f:
+                self.on_disk = True
+                if os.fstat(f.fileno()).st_size >= self.MMAP_THRESHOLD:
+                    self.lines = MappedLines(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                else:
+                    self.lines = f.read().decode('utf-8').splitlines()
+                    if not self.lines:
+                        self.lines = [""]
+                    elif len(self.lines) > LineRope.MIN_LINES:
+                        self.lines = LineRope(self.lines)
+            self.edit_y = None
             self.modified = False
+            self.mark_dirty_from(0)
+        except FileNotFoundError:
+            pass  # A new file
         except Exception as e:
+            # The file is there but unreadable; only a missing one is a new file
+            self.on_disk = True
             self.lines = [f"Error loading file: {str(e)}"]
+            self.edit_y = None
     
     def save_file(self, filename: Optional[str] = None):
         """Save buffer content to file."""
@@ -58,30 +359,87 @@ class TextBuffer:
         if not self.filename:
             return False
         
+        self.flush_edits()
+        # Write a fresh sibling of the real file (not a symlink to it) and swap
+        # it in: a memory-mapped buffer is still reading from the original,
+        # which must not be truncated underneath it
+        target = os.path.realpath(self.filename)
+        tmp_name = None
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(self.lines))
+            fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(target),
+                                            prefix='.' + os.path.basename(target) + '.')
+            # One encode and one write, with no text-layer newline translation
+            with open(fd, 'wb') as f:
+                f.write('\n'.join(self.lines).encode('utf-8'))
+            try:
+                shutil.copymode(target, tmp_name)
+            except FileNotFoundError:
+                # A new file gets the permissions open() would have given it
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_name, 0o666 & ~umask)
+            os.replace(tmp_name, target)
             self.modified = False
             return True
         except Exception:
+            if tmp_name is not None:
+                try:
+                    os.remove(tmp_name)
+                except OSError:
+                    pass
             return False
     
+    def mark_dirty_from(self, line_num: int):
+        """Mark every line from line_num to the end of the buffer for redraw."""
+        if self.dirty_from is None or line_num < self.dirty_from:
+            self.dirty_from = line_num
+    
+    def clear_dirty(self):
+        """Forget pending redraws once the screen is up to date."""
+        self.dirty_lines.clear()
+        self.dirty_from = None
+    
+    def flush_edits(self):
+        """Turn the line being edited back into a plain str."""
+        if self.edit_y is not None:
+            self.lines[self.edit_y] = str(self.lines[self.edit_y])
+            self.edit_y = None
+    
+    def edit_line(self) -> GapLine:
+        """The cursor line as a GapLine, flushing any other line being edited."""
+        if self.edit_y != self.cursor_y:
+            self.flush_edits()
+            self.lines[self.cursor_y] = GapLine(self.lines[self.cursor_y])
+            self.edit_y = self.cursor_y
+        return self.lines[self.cursor_y]
+    
     def insert_char(self, char: str):
         """Insert character at cursor position."""
-        line = self.lines[self.cursor_y]
-        self.lines[self.cursor_y] = line[:self.cursor_x] + char + line[self.cursor_x:]
+        self.edit_line().insert(self.cursor_x, char)
+        self.dirty_lines.add(self.cursor_y)
         self.cursor_x += 1
         self.modified = True
     
+    def insert_str(self, text: str):
+        """Insert text without line breaks at cursor position."""
+        if not text:
+            return
+        self.edit_line().insert_text(self.cursor_x, text)
+        self.dirty_lines.add(self.cursor_y)
+        self.cursor_x += len(text)
+        self.modified = True
+    
     def delete_char(self):
         """Delete character before cursor (backspace)."""
         if self.cursor_x > 0:
-            line = self.lines[self.cursor_y]
-            self.lines[self.cursor_y] = line[:self.cursor_x-1] + line[self.cursor_x:]
+            self.edit_line().delete_before(self.cursor_x)
+            self.dirty_lines.add(self.cursor_y)
             self.cursor_x -= 1
             self.modified = True
         elif self.cursor_y > 0:
             # Join with previous line
+            self.flush_edits()
+            self.mark_dirty_from(self.cursor_y - 1)
             self.cursor_x = len(self.lines[self.cursor_y - 1])
             self.lines[self.cursor_y - 1] += self.lines[self.cursor_y]
             del self.lines[self.cursor_y]
@@ -90,52 +448,123 @@ class TextBuffer:
     
     def delete_forward(self):
         """Delete character at cursor (delete key)."""
-        line = self.lines[self.cursor_y]
-        if self.cursor_x < len(line):
-            self.lines[self.cursor_y] = line[:self.cursor_x] + line[self.cursor_x+1:]
+        if self.cursor_x < len(self.lines[self.cursor_y]):
+            self.edit_line().delete_at(self.cursor_x)
+            self.dirty_lines.add(self.cursor_y)
             self.modified = True
         elif self.cursor_y < len(self.lines) - 1:
             # Join with next line
+            self.flush_edits()
+            self.mark_dirty_from(self.cursor_y)
             self.lines[self.cursor_y] += self.lines[self.cursor_y + 1]
             del self.lines[self.cursor_y + 1]
             self.modified = True
     
     def insert_newline(self):
         """Insert new line at cursor position."""
+        self.flush_edits()
         line = self.lines[self.cursor_y]
         self.lines[self.cursor_y] = line[:self.cursor_x]
         self.lines.insert(self.cursor_y + 1, line[self.cursor_x:])
+        self.mark_dirty_from(self.cursor_y)
         self.cursor_y += 1
         self.cursor_x = 0
         self.modified = True
     
     def move_cursor(self, dx: int, dy: int, max_x: int, max_y: int):
         """Move cursor with bounds checking."""
-        new_y = max(0, min(len(self.lines) - 1, self.cursor_y + dy))
-        new_x = max(0, min(len(self.lines[new_y]), self.cursor_x + dx))
+        lines = self.lines
+        new_y = self.cursor_y + dy
+        if new_y < 0:
+            new_y = 0
+        elif new_y >= len(lines):
+            new_y = len(lines) - 1
+        
+        new_x = self.cursor_x + dx
+        if new_x < 0:
+            new_x = 0
+        else:
+            line_len = len(lines[new_y])
+            if new_x > line_len:
+                new_x = line_len
         
         self.cursor_y = new_y
         self.cursor_x = new_x
         
         # Adjust scroll if needed
-        if self.cursor_y < self.scroll_y:
-            self.scroll_y = self.cursor_y
-        elif self.cursor_y >= self.scroll_y + max_y:
-            self.scroll_y = self.cursor_y - max_y + 1
+        scroll_y = self.scroll_y
+        if new_y < scroll_y:
+            self.scroll_y = new_y
+        elif new_y >= scroll_y + max_y:
+            self.scroll_y = new_y - max_y + 1
+    
+    def move_home(self):
+        """Move cursor to start of line."""
+        self.cursor_x = 0
+    
+    def move_end(self):
+        """Move cursor to end of line."""
+        self.cursor_x = len(self.lines[self.cursor_y])
     
     def get_display_name(self) -> str:
         """Get display name for tab."""
-        name = os.path.basename(self.filename) if self.filename else "Untitled"
-        return f"*{name}" if self.modified else name
+        key = (self.filename, self.modified)
+        if key != self.display_name_key:
+            name = os.path.basename(self.filename) if self.filename else "Untitled"
+            self.display_name = f"*{name}" if self.modified else name
+            self.display_name_key = key
+        return self.display_name
 
 
 class TerminalNotepad:
     """Main application class."""
     
+    # Keys whose handlers read input of their own
+    PROMPT_KEYS = frozenset((15, 19))  # Ctrl+O, Ctrl+S
+    
+    # Status bar text, filled in by draw_status
+    STATUS_FORMAT = " Line {line}, Col {col} | {name}{modified}"
+    STATUS_CONTROLS = " | Ctrl+N:New Ctrl+O:Open Ctrl+S:Save Ctrl+Q:Quit"
+    
     def __init__(self, initial_files: List[str] = None):
         self.tabs: List[TextBuffer] = []
         self.current_tab = 0
         
+        # What each part of the screen was last drawn from; a part is only
+        # redrawn when this changes
+        self.drawn_tabs = None
+        self.drawn_view = None
+        self.drawn_status = None
+        
+        # Transient status bar message and when (time.monotonic()) it expires
+        self.message: Optional[str] = None
+        self.message_until: Optional[float] = None
+        
+        # Key handlers, called as handler(stdscr, buffer, rows, width) where
+        # rows is the height of the text area
+        self.keymap: Dict[int, Callable] = {
+            14: lambda *_: self.add_tab(),                     # Ctrl+N
+            15: lambda stdscr, *_: self.handle_open(stdscr),   # Ctrl+O
+            19: lambda stdscr, *_: self.handle_save(stdscr),   # Ctrl+S
+            23: lambda *_: self.close_tab(),                   # Ctrl+W
+            9: lambda *_: self.switch_tab(1),                  # Tab
+            560: lambda *_: self.switch_tab(-1),               # Ctrl+Left
+            545: lambda *_: self.switch_tab(1),                # Ctrl+Right
+            curses.KEY_UP: lambda _, buffer, rows, width: buffer.move_cursor(0, -1, width, rows),
+            curses.KEY_DOWN: lambda _, buffer, rows, width: buffer.move_cursor(0, 1, width, rows),
+            curses.KEY_LEFT: lambda _, buffer, rows, width: buffer.move_cursor(-1, 0, width, rows),
+            curses.KEY_RIGHT: lambda _, buffer, rows, width: buffer.move_cursor(1, 0, width, rows),
+            curses.KEY_HOME: lambda _, buffer, *__: buffer.move_home(),
+            curses.KEY_END: lambda _, buffer, *__: buffer.move_end(),
+            curses.KEY_PPAGE: lambda _, buffer, rows, width: buffer.move_cursor(0, -rows, width, rows),
+            curses.KEY_NPAGE: lambda _, buffer, rows, width: buffer.move_cursor(0, rows, width, rows),
+            curses.KEY_BACKSPACE: lambda _, buffer, *__: buffer.delete_char(),
+            127: lambda _, buffer, *__: buffer.delete_char(),  # Backspace
+            curses.KEY_DC: lambda _, buffer, *__: buffer.delete_forward(),
+            10: lambda _, buffer, *__: buffer.insert_newline(),  # Enter
+            13: lambda _, buffer, *__: buffer.insert_newline(),
+        }
+        
         # Initialize with files or empty tab
         if initial_files:
             for filename in initial_files:
@@ -160,12 +589,41 @@ class TerminalNotepad:
         if len(self.tabs) > 1:
             self.current_tab = (self.current_tab + direction) % len(self.tabs)
     
+    def insert_typed(self, stdscr, buffer: TextBuffer, key: int):
+        """Insert a typed key plus any already queued behind it (a paste) before the next redraw."""
+        chars = [chr(key)]
+        stdscr.nodelay(True)
+        try:
+            while True:
+                key = stdscr.getch()
+                if 32 <= key <= 126:
+                    chars.append(chr(key))
+                elif key == 10 or key == 13:
+                    if chars:
+                        buffer.insert_str(''.join(chars))
+                    buffer.insert_newline()
+                    chars = []
+                else:
+                    if key != -1:
+                        curses.ungetch(key)  # Leave it for the main loop
+                    break
+        finally:
+            stdscr.nodelay(False)
+        
+        if chars:
+            buffer.insert_str(''.join(chars))
+    
     def get_current_buffer(self) -> TextBuffer:
         """Get currently active text buffer."""
         return self.tabs[self.current_tab]
     
     def draw_tabs(self, stdscr, width: int):
         """Draw tab bar at top of screen."""
+        tabs_sig = (self.current_tab, tuple((tab.filename, tab.modified) for tab in self.tabs), width)
+        if tabs_sig == self.drawn_tabs:
+            return
+        self.drawn_tabs = tabs_sig
+        
         stdscr.attron(curses.color_pair(1))
         stdscr.addstr(0, 0, " " * width)
         
@@ -196,40 +654,64 @@ class TerminalNotepad:
         """Draw text content area."""
         buffer = self.get_current_buffer()
         
+        # Scrolling, switching tabs or resizing shifts every row; otherwise
+        # only the lines edited since the last frame are redrawn
+        view = (id(buffer), buffer.scroll_y, height, width)
+        if view != self.drawn_view:
+            self.drawn_view = view
+            buffer.mark_dirty_from(0)
+            stdscr.move(height - 2, 0)
+            stdscr.clrtoeol()
+        
         # Draw text lines
         for i in range(height - 3):  # Reserve space for tabs and status
             line_num = buffer.scroll_y + i
-            if line_num < len(buffer.lines):
-                line = buffer.lines[line_num]
-                if len(line) > width:
-                    line = line[:width-1]
-                stdscr.addstr(i + 1, 0, line)
+            if line_num not in buffer.dirty_lines and (buffer.dirty_from is None or line_num < buffer.dirty_from):
+                continue
             
-            # Clear rest of line
+            # Clear the old row
+            stdscr.move(i + 1, 0)
             stdscr.clrtoeol()
+            if line_num < len(buffer.lines):
+                line = clip_to_width(str(buffer.lines[line_num]), width)
+                stdscr.addstr(i + 1, 0, line)
+        
+        buffer.clear_dirty()
     
     def draw_status(self, stdscr, height: int, width: int):
         """Draw status bar at bottom."""
         buffer = self.get_current_buffer()
-        status = f" Line {buffer.cursor_y + 1}, Col {buffer.cursor_x + 1}"
-        
-        if buffer.filename:
-            status += f" | {buffer.filename}"
-        else:
-            status += " | Untitled"
         
-        if buffer.modified:
-            status += " [Modified]"
+        # Everything the status text is built from; skip the rebuild when unchanged
+        status_sig = (buffer.cursor_y, buffer.cursor_x, buffer.filename, buffer.modified,
+                      self.message, height, width)
+        if status_sig == self.drawn_status:
+            return
+        self.drawn_status = status_sig
         
-        # Controls hint
-        controls = " | Ctrl+N:New Ctrl+O:Open Ctrl+S:Save Ctrl+Q:Quit"
-        if len(status + controls) < width:
-            status += controls
+        if self.message is not None:
+            status = self.message
+        else:
+            status = self.STATUS_FORMAT.format_map({
+                'line': buffer.cursor_y + 1,
+                'col': buffer.cursor_x + 1,
+                'name': buffer.filename or "Untitled",
+                'modified': " [Modified]" if buffer.modified else "",
+            })
+            
+            # Controls hint
+            if len(status) + len(self.STATUS_CONTROLS) < width:
+                status += self.STATUS_CONTROLS
         
         stdscr.attron(curses.color_pair(1))
         stdscr.addstr(height - 1, 0, status.ljust(width)[:width])
         stdscr.attroff(curses.color_pair(1))
     
+    def show_message(self, message: str, seconds: float = 1.0):
+        """Show message in the status bar for a while, without blocking input."""
+        self.message = message
+        self.message_until = time.monotonic() + seconds
+    
     def handle_save(self, stdscr):
         """Handle save operation."""
         buffer = self.get_current_buffer()
@@ -237,8 +719,11 @@ class TerminalNotepad:
             # Get filename from user
             height, width = stdscr.getmaxyx()
             stdscr.addstr(height - 1, 0, "Save as: ".ljust(width))
-            stdscr.refresh()
+            stdscr.noutrefresh()
+            curses.doupdate()
             
+            # Wait for the whole answer, whatever timeout the main loop left set
+            stdscr.timeout(-1)
             curses.echo()
             filename = stdscr.getstr(height - 1, 9, width - 9).decode('utf-8')
             curses.noecho()
@@ -248,23 +733,31 @@ class TerminalNotepad:
         
         if buffer.save_file():
             # Show success message briefly
-            height, width = stdscr.getmaxyx()
-            stdscr.addstr(height - 1, 0, f"Saved: {buffer.filename}".ljust(width))
-            stdscr.refresh()
-            curses.napms(1000)
+            self.show_message(f"Saved: {buffer.filename}")
+        
+        # The prompt above was written over the status bar
+        self.drawn_status = None
     
     def handle_open(self, stdscr):
         """Handle open file operation."""
         height, width = stdscr.getmaxyx()
         stdscr.addstr(height - 1, 0, "Open file: ".ljust(width))
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
         
+        # Wait for the whole answer, whatever timeout the main loop left set
+        stdscr.timeout(-1)
         curses.echo()
         filename = stdscr.getstr(height - 1, 11, width - 11).decode('utf-8')
         curses.noecho()
         
-        if filename.strip() and os.path.exists(filename.strip()):
-            self.add_tab(filename.strip())
+        filename = filename.strip()
+        if filename:
+            buffer = TextBuffer(filename)
+            if buffer.on_disk:
+                self.tabs.append(buffer)
+                self.current_tab = len(self.tabs) - 1
+        self.drawn_status = None
     
     def run(self, stdscr):
         """Main application loop."""
@@ -276,11 +769,13 @@ class TerminalNotepad:
         # Configure curses
         curses.curs_set(1)  # Show cursor
         stdscr.keypad(True)
-        stdscr.timeout(100)  # Non-blocking input
+        
+        # Only re-read when curses reports a resize
+        height, width = stdscr.getmaxyx()
         
         while True:
-            height, width = stdscr.getmaxyx()
-            stdscr.clear()
+            if self.message_until is not None and time.monotonic() >= self.message_until:
+                self.message = self.message_until = None
             
             # Draw interface
             self.draw_tabs(stdscr, width)
@@ -291,58 +786,52 @@ class TerminalNotepad:
             buffer = self.get_current_buffer()
             cursor_screen_y = buffer.cursor_y - buffer.scroll_y + 1
             if 0 <= cursor_screen_y < height - 2:
-                stdscr.move(cursor_screen_y, buffer.cursor_x)
+                line = str(buffer.lines[buffer.cursor_y])
+                stdscr.move(cursor_screen_y, min(display_width(line[:buffer.cursor_x]), width - 1))
+            
+            stdscr.noutrefresh()
+            curses.doupdate()
             
-            stdscr.refresh()
+            # Block until a key (or KEY_RESIZE) arrives, waking early only to
+            # take down a status message
+            if self.message_until is None:
+                stdscr.timeout(-1)
+            else:
+                stdscr.timeout(max(1, int((self.message_until - time.monotonic()) * 1000)))
             
-            # Handle input
+            # Handle input, then every key already queued behind it (autorepeat,
+            # a burst of resizes) before drawing again
             try:
                 key = stdscr.getch()
             except:
                 continue
             
-            if key == -1:  # No input
-                continue
-            elif key == 17:  # Ctrl+Q
-                break
-            elif key == 14:  # Ctrl+N
-                self.add_tab()
-            elif key == 15:  # Ctrl+O
-                self.handle_open(stdscr)
-            elif key == 19:  # Ctrl+S
-                self.handle_save(stdscr)
-            elif key == 23:  # Ctrl+W
-                self.close_tab()
-            elif key == 9:   # Tab
-                self.switch_tab(1)
-            elif key == 560:  # Ctrl+Left
-                self.switch_tab(-1)
-            elif key == 545:  # Ctrl+Right
-                self.switch_tab(1)
-            elif key == curses.KEY_UP:
-                buffer.move_cursor(0, -1, width, height - 3)
-            elif key == curses.KEY_DOWN:
-                buffer.move_cursor(0, 1, width, height - 3)
-            elif key == curses.KEY_LEFT:
-                buffer.move_cursor(-1, 0, width, height - 3)
-            elif key == curses.KEY_RIGHT:
-                buffer.move_cursor(1, 0, width, height - 3)
-            elif key == curses.KEY_HOME:
-                buffer.cursor_x = 0
-            elif key == curses.KEY_END:
-                buffer.cursor_x = len(buffer.lines[buffer.cursor_y])
-            elif key == curses.KEY_PPAGE:  # Page Up
-                buffer.move_cursor(0, -(height - 3), width, height - 3)
-            elif key == curses.KEY_NPAGE:  # Page Down
-                buffer.move_cursor(0, height - 3, width, height - 3)
-            elif key == curses.KEY_BACKSPACE or key == 127:
-                buffer.delete_char()
-            elif key == curses.KEY_DC:  # Delete
-                buffer.delete_forward()
-            elif key == 10 or key == 13:  # Enter
-                buffer.insert_newline()
-            elif 32 <= key <= 126:  # Printable characters
-                buffer.insert_char(chr(key))
+            while key != -1:  # No input
+                if key == 17:  # Ctrl+Q
+                    return
+                elif key == curses.KEY_RESIZE:
+                    curses.update_lines_cols()
+                    height, width = stdscr.getmaxyx()
+                else:
+                    buffer = self.get_current_buffer()
+                    handler = self.keymap.get(key)
+                    if handler is not None:
+                        prompt = key in self.PROMPT_KEYS
+                        if prompt:
+                            # Never hand the draining zero timeout to a prompt
+                            stdscr.timeout(-1)
+                        handler(stdscr, buffer, height - 3, width)
+                        if prompt:
+                            # A resize while prompting went to the prompt's own input
+                            height, width = stdscr.getmaxyx()
+                    elif 32 <= key <= 126:  # Printable characters
+                        self.insert_typed(stdscr, buffer, key)
+                
+                stdscr.timeout(0)
+                try:
+                    key = stdscr.getch()
+                except:
+                    break
 
 
 def main():